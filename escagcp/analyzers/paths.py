@@ -2,15 +2,330 @@
 Attack path analyzer for finding privilege escalation and lateral movement paths
 """
 
+import heapq
+import json
+import os
+import re
+import time
 import networkx as nx
-from typing import Dict, Any, List, Optional, Set, Tuple
+import numpy as np
+from typing import Callable, Dict, Any, Iterable, List, Mapping, Optional, Set, Tuple
+from bisect import bisect_right
 from collections import defaultdict
+from itertools import combinations, islice
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor
 from ..graph.models import Node, Edge, NodeType, EdgeType, AttackPath
+from ..graph.query import bounded_simple_paths, _edge_type
 from ..utils import get_logger, Config, ProgressLogger
 
+# Try to import igraph for faster centrality computations
+try:
+    import igraph
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    IGRAPH_AVAILABLE = False
+
 
 logger = get_logger(__name__)
 
+# Node type lookup by raw value, avoiding Enum construction and ValueError handling
+_NODE_TYPES_BY_VALUE = {node_type.value: node_type for node_type in NodeType}
+
+# Node attributes that become Node fields rather than properties
+_NODE_PROPERTY_SKIP_KEYS = frozenset({'type', 'name'})
+
+# Base node risk for high-value targets, by node ID prefix
+_NODE_PREFIX_RISK = {
+    'org': 0.3,
+    'folder': 0.25,
+    'project': 0.2,
+    'sa': 0.15
+}
+
+# Escalation technique shown for each edge type in attack paths
+_ESCALATION_TECHNIQUES = {
+    EdgeType.CAN_IMPERSONATE_SA: {
+        'name': 'Service Account Impersonation',
+        'icon': '🔑',
+        'description': 'Generate access tokens for service account',
+        'permission': 'iam.serviceAccounts.getAccessToken'
+    },
+    EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: {
+        'name': 'Service Account Key Creation',
+        'icon': '🗝️',
+        'description': 'Create and download service account keys',
+        'permission': 'iam.serviceAccountKeys.create'
+    },
+    EdgeType.CAN_ACT_AS_VIA_VM: {
+        'name': 'VM ActAs Exploitation',
+        'icon': '💻',
+        'description': 'Deploy VM with service account attached',
+        'permission': 'iam.serviceAccounts.actAs + compute.instances.create'
+    },
+    EdgeType.CAN_DEPLOY_FUNCTION_AS: {
+        'name': 'Cloud Function Deployment',
+        'icon': '⚡',
+        'description': 'Deploy function running as service account',
+        'permission': 'cloudfunctions.functions.create + iam.serviceAccounts.actAs'
+    },
+    EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: {
+        'name': 'Cloud Run Deployment',
+        'icon': '🏃',
+        'description': 'Deploy Cloud Run service with SA',
+        'permission': 'run.services.create + iam.serviceAccounts.actAs'
+    },
+    EdgeType.CAN_TRIGGER_BUILD_AS: {
+        'name': 'Cloud Build Trigger',
+        'icon': '🔨',
+        'description': 'Trigger build running as service account',
+        'permission': 'cloudbuild.builds.create'
+    },
+    EdgeType.CAN_LOGIN_TO_VM: {
+        'name': 'VM SSH Access',
+        'icon': '🖥️',
+        'description': 'SSH into VM and access metadata service',
+        'permission': 'compute.instances.osLogin'
+    },
+    EdgeType.CAN_DEPLOY_GKE_POD_AS: {
+        'name': 'GKE Pod Deployment',
+        'icon': '☸️',
+        'description': 'Deploy pod in GKE with service account',
+        'permission': 'container.pods.create + iam.serviceAccounts.actAs'
+    },
+    EdgeType.CAN_SATISFY_IAM_CONDITION: {
+        'name': 'IAM Condition Bypass',
+        'icon': '🔓',
+        'description': 'Satisfy IAM conditions to gain access',
+        'permission': 'Varies by condition'
+    },
+    EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: {
+        'name': 'External Identity Impersonation',
+        'icon': '🌐',
+        'description': 'External identity can impersonate service account',
+        'permission': 'iam.workloadIdentityPools.providers.use'
+    },
+    EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: {
+        'name': 'Workload Identity Hijacking',
+        'icon': '🎭',
+        'description': 'Hijack GKE workload identity',
+        'permission': 'container.pods.create'
+    },
+    EdgeType.CAN_MODIFY_CUSTOM_ROLE: {
+        'name': 'Custom Role Modification',
+        'icon': '✏️',
+        'description': 'Modify custom role to add permissions',
+        'permission': 'iam.roles.update'
+    },
+    EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: {
+        'name': 'Default Service Account Usage',
+        'icon': '🤖',
+        'description': 'Launch resources using default service account',
+        'permission': 'Varies by service'
+    },
+    EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: {
+        'name': 'Service Account Attachment',
+        'icon': '📎',
+        'description': 'Attach service account to resources',
+        'permission': 'iam.serviceAccounts.actAs'
+    },
+    EdgeType.CAN_UPDATE_METADATA: {
+        'name': 'Metadata Manipulation',
+        'icon': '📝',
+        'description': 'Update instance metadata',
+        'permission': 'compute.instances.setMetadata'
+    },
+    EdgeType.CAN_ASSIGN_CUSTOM_ROLE: {
+        'name': 'Custom Role Assignment',
+        'icon': '🎯',
+        'description': 'Assign custom roles with dangerous permissions',
+        'permission': 'resourcemanager.projects.setIamPolicy'
+    },
+    EdgeType.HAS_TAG_BINDING_ESCALATION: {
+        'name': 'Tag-based Escalation',
+        'icon': '🏷️',
+        'description': 'Use tag bindings for privilege escalation',
+        'permission': 'resourcemanager.tagBindings.create'
+    },
+    EdgeType.CAN_SSH_AND_IMPERSONATE: {
+        'name': 'SSH + Impersonation',
+        'icon': '🔐',
+        'description': 'SSH access combined with impersonation',
+        'permission': 'compute.instances.osLogin + iam.serviceAccounts.getAccessToken'
+    },
+    EdgeType.HAS_ESCALATED_PRIVILEGE: {
+        'name': 'Confirmed Privilege Escalation',
+        'icon': '⚠️',
+        'description': 'Privilege escalation detected in audit logs',
+        'permission': 'N/A - detected from logs'
+    },
+    EdgeType.HAS_ROLE: {
+        'name': 'Role Assignment',
+        'icon': '👤',
+        'description': 'Has IAM role granting permissions',
+        # Replaced by the edge's role when the technique is built
+        'permission': 'IAM role'
+    },
+    EdgeType.MEMBER_OF: {
+        'name': 'Group Membership',
+        'icon': '👥',
+        'description': 'Member of group',
+        'permission': 'N/A'
+    },
+    EdgeType.CAN_ADMIN: {
+        'name': 'Administrative Access',
+        'icon': '👑',
+        'description': 'Full administrative control',
+        'permission': 'resourcemanager.projects.setIamPolicy'
+    },
+    EdgeType.CAN_WRITE: {
+        'name': 'Write Access',
+        'icon': '✍️',
+        'description': 'Can modify resources',
+        'permission': 'Varies by resource'
+    },
+    EdgeType.CAN_READ: {
+        'name': 'Read Access',
+        'icon': '👁️',
+        'description': 'Can view resources',
+        'permission': 'Varies by resource'
+    },
+    EdgeType.CAN_IMPERSONATE: {
+        'name': 'General Impersonation',
+        'icon': '🔑',
+        'description': 'Can impersonate identity',
+        'permission': 'iam.serviceAccounts.getAccessToken'
+    }
+}
+
+# Techniques for edges with no per-edge details, shared read-only by every path
+_SHARED_ESCALATION_TECHNIQUES = {
+    edge_type: MappingProxyType({**technique, 'edge_type': edge_type.value})
+    for edge_type, technique in _ESCALATION_TECHNIQUES.items()
+}
+
+# Known GCP permission for an edge type, assumed when the edge does not name one
+_KNOWN_PERMISSIONS = {
+    EdgeType.CAN_IMPERSONATE_SA: 'iam.serviceAccounts.getAccessToken',
+    EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: 'iam.serviceAccountKeys.create',
+    EdgeType.CAN_ACT_AS_VIA_VM: 'iam.serviceAccounts.actAs',
+    EdgeType.CAN_DEPLOY_FUNCTION_AS: 'cloudfunctions.functions.create',
+    EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: 'run.services.create',
+    EdgeType.CAN_TRIGGER_BUILD_AS: 'cloudbuild.builds.create',
+    EdgeType.CAN_LOGIN_TO_VM: 'compute.instances.osLogin',
+    EdgeType.CAN_ADMIN: 'resourcemanager.projects.setIamPolicy',
+    EdgeType.CAN_WRITE: 'storage.objects.create',
+    EdgeType.CAN_READ: 'storage.objects.get',
+    EdgeType.CAN_DEPLOY_GKE_POD_AS: 'container.pods.create',
+    EdgeType.CAN_SATISFY_IAM_CONDITION: 'iam.conditions.check',
+    EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: 'iam.workloadIdentityPools.providers.use',
+    EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: 'container.pods.create',
+    EdgeType.CAN_MODIFY_CUSTOM_ROLE: 'iam.roles.update',
+    EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: 'compute.instances.create',
+    EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: 'iam.serviceAccounts.actAs',
+    EdgeType.CAN_UPDATE_METADATA: 'compute.instances.setMetadata',
+    EdgeType.CAN_ASSIGN_CUSTOM_ROLE: 'resourcemanager.projects.setIamPolicy',
+    EdgeType.HAS_TAG_BINDING_ESCALATION: 'resourcemanager.tagBindings.create',
+    EdgeType.CAN_SSH_AND_IMPERSONATE: 'compute.instances.osLogin',
+    EdgeType.HAS_ESCALATED_PRIVILEGE: 'N/A - detected from logs',
+    EdgeType.HAS_ROLE: 'iam.roles.get',
+    EdgeType.MEMBER_OF: 'N/A - group membership',
+    EdgeType.CAN_IMPERSONATE: 'iam.serviceAccounts.getAccessToken'
+}
+
+# Every edge type, with a permission derived from its value where none is known above
+_INFERRED_PERMISSIONS = {
+    edge_type: _KNOWN_PERMISSIONS.get(edge_type) or edge_type.value.lower().replace('_', '.')
+    for edge_type in EdgeType
+}
+
+# Node risk level for scores at or above each threshold, lowest first
+_RISK_LEVEL_THRESHOLDS = (0.2, 0.4, 0.6, 0.8)
+_RISK_LEVELS = ('info', 'low', 'medium', 'high', 'critical')
+
+# Visualization metadata for attack path nodes and edges
+_NODE_ICONS = {
+    NodeType.USER: '👤',
+    NodeType.SERVICE_ACCOUNT: '🤖',
+    NodeType.GROUP: '👥',
+    NodeType.PROJECT: '📁',
+    NodeType.FOLDER: '📂',
+    NodeType.ORGANIZATION: '🏢',
+    NodeType.ROLE: '🎭',
+    NodeType.CUSTOM_ROLE: '🎨',
+    NodeType.RESOURCE: '📦',
+    NodeType.BUCKET: '🪣',
+    NodeType.INSTANCE: '💻',
+    NodeType.FUNCTION: '⚡',
+    NodeType.SECRET: '🔐',
+    NodeType.KMS_KEY: '🔑',
+    NodeType.CLOUD_RUN_SERVICE: '🏃',
+    NodeType.GKE_CLUSTER: '☸️'
+}
+
+_NODE_COLORS = {
+    NodeType.USER: '#4285F4',
+    NodeType.SERVICE_ACCOUNT: '#34A853',
+    NodeType.GROUP: '#FBBC04',
+    NodeType.PROJECT: '#EA4335',
+    NodeType.FOLDER: '#FF6D00',
+    NodeType.ORGANIZATION: '#9C27B0',
+    NodeType.ROLE: '#757575',
+    NodeType.CUSTOM_ROLE: '#616161',
+    NodeType.RESOURCE: '#00ACC1'
+}
+
+# Known edge labels. HAS_ROLE edges are labelled with their role rather than from this map
+_KNOWN_EDGE_LABELS = {
+    EdgeType.CAN_IMPERSONATE_SA: 'impersonate',
+    EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: 'create key',
+    EdgeType.CAN_ACT_AS_VIA_VM: 'actAs VM',
+    EdgeType.CAN_DEPLOY_FUNCTION_AS: 'deploy function',
+    EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: 'deploy run',
+    EdgeType.CAN_TRIGGER_BUILD_AS: 'trigger build',
+    EdgeType.CAN_LOGIN_TO_VM: 'SSH access',
+    EdgeType.CAN_ADMIN: 'admin',
+    EdgeType.CAN_WRITE: 'write',
+    EdgeType.CAN_READ: 'read',
+    EdgeType.CAN_DEPLOY_GKE_POD_AS: 'deploy pod',
+    EdgeType.CAN_SATISFY_IAM_CONDITION: 'satisfy condition',
+    EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: 'external impersonate',
+    EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: 'hijack workload',
+    EdgeType.CAN_MODIFY_CUSTOM_ROLE: 'modify role',
+    EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: 'use default SA',
+    EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: 'attach SA',
+    EdgeType.CAN_UPDATE_METADATA: 'update metadata',
+    EdgeType.CAN_ASSIGN_CUSTOM_ROLE: 'assign role',
+    EdgeType.HAS_TAG_BINDING_ESCALATION: 'tag escalation',
+    EdgeType.CAN_SSH_AND_IMPERSONATE: 'SSH + impersonate',
+    EdgeType.HAS_ESCALATED_PRIVILEGE: 'escalated',
+    EdgeType.MEMBER_OF: 'member of',
+    EdgeType.CAN_IMPERSONATE: 'impersonate'
+}
+
+# Every edge type, labelled from its value where none is given above
+_EDGE_LABELS = {
+    edge_type: _KNOWN_EDGE_LABELS.get(edge_type) or edge_type.value.replace('_', ' ').lower()
+    for edge_type in EdgeType
+}
+
+_EDGE_COLORS = {
+    EdgeType.HAS_ROLE: '#757575',
+    EdgeType.MEMBER_OF: '#9E9E9E',
+    EdgeType.CAN_ADMIN: '#FF5722',
+    EdgeType.CAN_WRITE: '#FF9800',
+    EdgeType.CAN_READ: '#FFC107'
+}
+
+# Most identities per task handed to a multi-hop search worker process
+_IDENTITY_CHUNK_SIZE = 64
+
+# Tasks per worker process, so workers that draw cheap identities pick up more work
+_CHUNKS_PER_WORKER = 4
+
+# Search steps between clock checks when the multi-hop search has a deadline
+_DEADLINE_CHECK_STEPS = 1024
+
 
 class PathAnalyzer:
     """
@@ -41,6 +356,12 @@ class PathAnalyzer:
         EdgeType.HAS_ESCALATED_PRIVILEGE
     }
     
+    # Raw edge type values of ESCALATION_EDGE_TYPES, as stored on graph edges
+    ESCALATION_EDGE_VALUES = frozenset(edge_type.value for edge_type in ESCALATION_EDGE_TYPES)
+    
+    # Visualization color by edge type, with escalation edges drawn red
+    EDGE_COLORS = {**_EDGE_COLORS, **dict.fromkeys(ESCALATION_EDGE_TYPES, '#FF0000')}
+    
     # High-value target roles
     HIGH_VALUE_ROLES = {
         'roles/owner',
@@ -53,6 +374,20 @@ class PathAnalyzer:
         'roles/resourcemanager.projectIamAdmin'
     }
     
+    # Edge types that make any attack path through them critical or high risk
+    CRITICAL_PATH_EDGE_TYPES = frozenset({EdgeType.CAN_IMPERSONATE_SA, EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY})
+    HIGH_PATH_EDGE_TYPES = frozenset({
+        EdgeType.CAN_DEPLOY_FUNCTION_AS,
+        EdgeType.CAN_DEPLOY_CLOUD_RUN_AS,
+        EdgeType.CAN_ACT_AS_VIA_VM
+    })
+    
+    # Total risk score above which a node counts as high risk in the statistics
+    HIGH_RISK_NODE_THRESHOLD = 0.7
+    
+    # Graphs up to this size always get exact betweenness centrality
+    EXACT_CENTRALITY_MAX_NODES = 1000
+    
     def __init__(self, graph: nx.DiGraph, config: Config):
         """
         Initialize path analyzer
@@ -64,18 +399,69 @@ class PathAnalyzer:
         self.graph = graph
         self.config = config
         self._attack_paths = defaultdict(list)
+        # Paths reported to each bucket, whether kept in _attack_paths or passed to a sink
+        self._path_counts: Dict[str, int] = defaultdict(int)
+        self._sink: Optional[Callable[[str, AttackPath], None]] = None
         self._risk_scores = {}
+        # Nodes whose total risk score is above HIGH_RISK_NODE_THRESHOLD
+        self._high_risk_node_count = 0
         self._vulnerabilities = []
         self._critical_nodes = []
+        # Node ID tuples already reported in each attack path bucket
+        self._seen_paths: Dict[str, Set[Tuple[str, ...]]] = defaultdict(set)
+        # Node objects, and Edge objects with their risk score, escalation technique and
+        # permission, shared by every attack path that traverses them
+        self._node_cache: Dict[str, Node] = {}
+        # Visualization metadata for each node and edge, shared the same way
+        self._node_metadata_cache: Dict[str, Mapping[str, Any]] = {}
+        self._edge_metadata_cache: Dict[Tuple[str, str], Mapping[str, Any]] = {}
+        self._edge_cache: Dict[Tuple[str, str], Tuple[Edge, float, Mapping[str, Any], str]] = {}
+        # Role substrings matched in one regex scan per role node ID instead of one
+        # substring check per configured role
+        self._dangerous_roles_re = self._compile_role_matcher(self.config.analysis_dangerous_roles)
+        self._high_value_roles_re = self._compile_role_matcher(self.HIGH_VALUE_ROLES)
+        # Email suffixes of the organization's own users, for str.endswith
+        self._internal_suffixes = tuple(
+            '@' + domain.lstrip('@') for domain in self.config.analysis_internal_domains
+        )
+        # Role nodes are shared by many principals; match each against the dangerous roles once
+        self._role_is_dangerous: Dict[str, bool] = {}
+        self._classify_nodes()
     
-    def analyze_all_paths(self) -> Dict[str, Any]:
+    def _classify_nodes(self):
+        """Bucket node IDs by prefix and collect identity and high-value nodes in one pass"""
+        self._nodes_by_prefix: Dict[str, List[str]] = defaultdict(list)
+        # Potential attackers, in graph order
+        self._identity_nodes: List[str] = []
+        # Service accounts with privileges, high-value roles and resources, in graph order
+        self._high_value_nodes: List[str] = []
+        high_value_roles = self._high_value_roles_re
+        
+        for node_id in self.graph.nodes():
+            prefix = node_id.split(':', 1)[0]
+            self._nodes_by_prefix[prefix].append(node_id)
+            
+            if prefix in ('user', 'sa', 'group'):
+                self._identity_nodes.append(node_id)
+            
+            if prefix == 'sa' or prefix in ('project', 'folder', 'org'):
+                self._high_value_nodes.append(node_id)
+            elif prefix == 'role' and high_value_roles and high_value_roles.search(node_id):
+                self._high_value_nodes.append(node_id)
+    
+    def analyze_all_paths(self, sink: Optional[Callable[[str, AttackPath], None]] = None) -> Dict[str, Any]:
         """
         Perform comprehensive path analysis
         
+        Args:
+            sink: Optional callback receiving each attack path with its bucket name as it
+                is found; paths passed to it are not kept in the results
+        
         Returns:
             Analysis results dictionary
         """
         logger.info("Starting comprehensive path analysis")
+        self._sink = sink
         
         # Find privilege escalation paths
         self._find_privilege_escalation_paths()
@@ -93,18 +479,37 @@ class PathAnalyzer:
         self._detect_vulnerabilities()
         
         # Compile results
+        statistics = self._calculate_statistics()
         results = {
-            'attack_paths': dict(self._attack_paths),
+            # Read-only view of the buckets rather than a copy
+            'attack_paths': MappingProxyType(self._attack_paths),
             'risk_scores': self._risk_scores,
             'critical_nodes': self._critical_nodes,
             'vulnerabilities': self._vulnerabilities,
-            'statistics': self._calculate_statistics()
+            'statistics': statistics
         }
         
-        logger.info(f"Analysis complete. Found {self._calculate_statistics()['total_attack_paths']} attack paths")
+        logger.info(f"Analysis complete. Found {statistics['total_attack_paths']} attack paths")
         
         return results
     
+    def stream_to_jsonl(self, output_path: str) -> Dict[str, Any]:
+        """
+        Perform path analysis, writing attack paths to a JSON Lines file as they are found
+        
+        Args:
+            output_path: Path of the JSON Lines file to write
+            
+        Returns:
+            Analysis results dictionary, without the attack paths
+        """
+        with open(output_path, 'w') as f:
+            def write_path(bucket: str, attack_path: AttackPath):
+                record = {'category': bucket, **attack_path.to_dict()}
+                f.write(json.dumps(record, default=str) + '\n')
+            
+            return self.analyze_all_paths(sink=write_path)
+    
     def find_paths_from_identity(self, identity_id: str) -> List[AttackPath]:
         """
         Find all attack paths from a specific identity
@@ -117,21 +522,28 @@ class PathAnalyzer:
         """
         paths = []
         
+        # Only service accounts within the path length cutoff of the identity can have paths
+        reachable = nx.single_source_shortest_path_length(
+            self.graph,
+            identity_id,
+            cutoff=self.config.analysis_max_path_length
+        )
+        
+        # Optional cap on paths reported per service account
+        max_paths = self.config.analysis_max_paths_per_pair or None
+        
         # Find paths to service accounts (impersonation)
-        for node_id in self.graph.nodes():
-            if node_id.startswith('sa:') and node_id != identity_id:
-                try:
-                    for path in nx.all_simple_paths(
-                        self.graph,
-                        identity_id,
-                        node_id,
-                        cutoff=self.config.analysis_max_path_length
-                    ):
-                        attack_path = self._build_attack_path(path)
-                        if attack_path:
-                            paths.append(attack_path)
-                except nx.NetworkXNoPath:
-                    continue
+        for node_id in self._nodes_by_prefix.get('sa', []):
+            if node_id in reachable and node_id != identity_id:
+                for path in islice(bounded_simple_paths(
+                    self.graph,
+                    identity_id,
+                    node_id,
+                    cutoff=self.config.analysis_max_path_length
+                ), max_paths):
+                    attack_path = self._build_attack_path(path)
+                    if attack_path:
+                        paths.append(attack_path)
         
         return paths
     
@@ -141,242 +553,637 @@ class PathAnalyzer:
         
         # Find all edges that represent privilege escalation
         escalation_edges = []
+        escalation_values = self.ESCALATION_EDGE_VALUES
         for source, target, data in self.graph.edges(data=True):
             edge_type_str = data.get('type')
-            if edge_type_str:
-                try:
-                    edge_type = EdgeType(edge_type_str)
-                    if edge_type in self.ESCALATION_EDGE_TYPES:
-                        escalation_edges.append((source, target, edge_type, data))
-                except ValueError:
-                    # Unknown edge type
-                    continue
+            if edge_type_str in escalation_values:
+                escalation_edges.append((source, target, _edge_type(edge_type_str), data))
         
         logger.info(f"Found {len(escalation_edges)} privilege escalation edges")
         
         # For each escalation edge, create an attack path
         for source, target, edge_type, edge_data in escalation_edges:
+            # Categorize by severity
+            if edge_type in {EdgeType.CAN_IMPERSONATE_SA, EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY}:
+                bucket = 'critical'
+            elif edge_type in {EdgeType.CAN_DEPLOY_FUNCTION_AS, EdgeType.CAN_DEPLOY_CLOUD_RUN_AS}:
+                bucket = 'high'
+            else:
+                bucket = 'medium'
+            
             # Create a simple path from source to target
             path = [source, target]
-            attack_path = self._build_attack_path(path)
+            if not self._claim_path(bucket, path):
+                continue
+            
+            # Add details about the escalation
+            description = f"{edge_type.value}: {source} -> {target}"
+            if 'via_role' in edge_data:
+                description += f" (via {edge_data['via_role']})"
             
+            attack_path = self._build_attack_path(path, description=description)
             if attack_path:
-                # Add details about the escalation
-                attack_path.description = f"{edge_type.value}: {source} -> {target}"
-                if 'via_role' in edge_data:
-                    attack_path.description += f" (via {edge_data['via_role']})"
-                
-                # Categorize by severity
-                if edge_type in {EdgeType.CAN_IMPERSONATE_SA, EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY}:
-                    self._attack_paths['critical'].append(attack_path)
-                elif edge_type in {EdgeType.CAN_DEPLOY_FUNCTION_AS, EdgeType.CAN_DEPLOY_CLOUD_RUN_AS}:
-                    self._attack_paths['high'].append(attack_path)
-                else:
-                    self._attack_paths['medium'].append(attack_path)
+                self._report_path(bucket, attack_path)
         
         # Find multi-hop paths - this is critical for detecting chained attacks
         logger.info("Finding multi-hop privilege escalation paths")
         
-        # Get all identity nodes (potential attackers)
-        identity_nodes = [n for n in self.graph.nodes() if n.startswith(('user:', 'sa:', 'group:'))]
-        
-        # Get all high-value nodes (service accounts with privileges, high-value resources)
-        high_value_nodes = []
-        for node_id, node_data in self.graph.nodes(data=True):
-            # Include service accounts
-            if node_id.startswith('sa:'):
-                high_value_nodes.append(node_id)
-            # Include roles
-            elif node_id.startswith('role:') and any(r in node_id for r in self.HIGH_VALUE_ROLES):
-                high_value_nodes.append(node_id)
-            # Include resources
-            elif node_id.startswith(('project:', 'folder:', 'org:')):
-                high_value_nodes.append(node_id)
+        identity_nodes = self._identity_nodes
+        high_value_nodes = self._high_value_nodes
         
         logger.info(f"Checking paths from {len(identity_nodes)} identities to {len(high_value_nodes)} high-value targets")
         
         # Find paths between identities and high-value targets
+        escalation_distance = self._escalation_distances(escalation_edges)
+        target_distance = self._target_distances(high_value_nodes)
+        target_order = {node_id: i for i, node_id in enumerate(high_value_nodes)}
+        adjacency = self._escalation_adjacency(escalation_values, target_order, target_distance)
+        max_length = self.config.analysis_max_path_length
+        if max_length is None:
+            max_length = len(self.graph) - 1
+        
+        # Only identities that can reach both an escalation edge and a target within
+        # the cutoff can have paths
+        searchable = [
+            identity for identity in identity_nodes
+            if escalation_distance.get(identity, max_length + 1) <= max_length
+            and target_distance.get(identity, max_length + 1) <= max_length
+        ]
+        
+        # Optional wall-clock and path count budgets for the whole search
+        time_budget = self.config.analysis_time_budget_s
+        deadline = time.monotonic() + time_budget if time_budget else None
+        remaining_paths = self.config.analysis_max_total_paths or None
+        max_paths_per_pair = self.config.analysis_max_paths_per_pair
+        out_of_budget = False
+        # Identity and target pairs with more paths than max_paths_per_pair
+        limited_pairs = 0
+        
         multi_step_count = 0
-        for identity in identity_nodes:
-            for target in high_value_nodes:
-                if identity == target:
-                    continue
-                    
-                try:
-                    # Find all simple paths up to max length
-                    paths = list(nx.all_simple_paths(
-                        self.graph,
-                        identity,
-                        target,
-                        cutoff=self.config.analysis_max_path_length
-                    ))
+        identity_paths = self._search_escalation_paths(
+            searchable,
+            target_order,
+            max_length,
+            adjacency,
+            escalation_distance,
+            target_distance,
+            max_paths_per_pair,
+            deadline
+        )
+        for searched, (identity, found_paths, limited_targets) in enumerate(identity_paths):
+            if self._bucket_full('critical_multi_step') and self._bucket_full('privilege_escalation'):
+                logger.info("Attack path limit reached; stopping multi-hop search")
+                break
+            
+            # Collect this identity's paths per target so they are reported in target order
+            paths_by_target = defaultdict(list)
+            for path, path_escalations in found_paths:
+                if remaining_paths is not None:
+                    if remaining_paths <= 0:
+                        out_of_budget = True
+                        break
+                    remaining_paths -= 1
+                if deadline is not None and time.monotonic() > deadline:
+                    out_of_budget = True
+                    break
+                paths_by_target[path[-1]].append((path, path_escalations))
+            
+            # The search itself also gives up at the deadline, ending the loop above early
+            if deadline is not None and time.monotonic() > deadline:
+                out_of_budget = True
+            
+            limited_pairs += len(limited_targets)
+            
+            for target in sorted(paths_by_target, key=target_order.__getitem__):
+                for path, path_escalations in paths_by_target[target]:
+                    escalation_count = len(path_escalations)
                     
-                    for path in paths:
-                        if len(path) < 2:  # Skip invalid paths
+                    # Multi-step attacks are critical
+                    if escalation_count >= 2:
+                        if not self._claim_path('critical_multi_step', path):
                             continue
-                            
-                        # Count escalation steps in this path
-                        escalation_count = 0
-                        escalation_types = []
-                        escalation_edges_in_path = []
                         
-                        for i in range(len(path) - 1):
-                            edge_data = self.graph.get_edge_data(path[i], path[i + 1])
-                            if edge_data:
-                                edge_type_str = edge_data.get('type')
-                                if edge_type_str:
-                                    try:
-                                        edge_type = EdgeType(edge_type_str)
-                                        if edge_type in self.ESCALATION_EDGE_TYPES:
-                                            escalation_count += 1
-                                            escalation_types.append(edge_type.value)
-                                            escalation_edges_in_path.append((path[i], path[i + 1], edge_type))
-                                    except ValueError:
-                                        continue
+                        # Build detailed description
+                        step_descriptions = []
+                        for j, edge_type_str in enumerate(path_escalations):
+                            step_descriptions.append(f"Step {j+1}: {edge_type_str}")
                         
-                        # Multi-step attacks are critical
-                        if escalation_count >= 2:
-                            attack_path = self._build_attack_path(path)
-                            if attack_path:
-                                # Set high risk score for multi-step attacks
-                                attack_path.risk_score = min(0.85 + (escalation_count - 2) * 0.05, 1.0)
-                                
-                                # Build detailed description
-                                step_descriptions = []
-                                for j, (src, tgt, etype) in enumerate(escalation_edges_in_path):
-                                    step_descriptions.append(f"Step {j+1}: {etype.value}")
-                                
-                                attack_path.description = f"Multi-step attack ({escalation_count} steps): {' → '.join(step_descriptions)}"
-                                
-                                # Add to critical multi-step category
-                                if 'critical_multi_step' not in self._attack_paths:
-                                    self._attack_paths['critical_multi_step'] = []
-                                self._attack_paths['critical_multi_step'].append(attack_path)
-                                multi_step_count += 1
-                                
-                                # Log for debugging
-                                logger.debug(f"Found multi-step path: {identity} -> {target} ({escalation_count} steps)")
-                        
-                        elif escalation_count == 1:
-                            # Single-step escalation
-                            attack_path = self._build_attack_path(path)
-                            if attack_path:
-                                self._attack_paths['privilege_escalation'].append(attack_path)
+                        attack_path = self._build_attack_path(
+                            path,
+                            description=f"Multi-step attack ({escalation_count} steps): {' → '.join(step_descriptions)}",
+                            # Set high risk score for multi-step attacks
+                            risk_score=min(0.85 + (escalation_count - 2) * 0.05, 1.0)
+                        )
+                        if attack_path:
+                            # Add to critical multi-step category
+                            self._report_path('critical_multi_step', attack_path)
+                            multi_step_count += 1
                             
-                except nx.NetworkXNoPath:
-                    continue
-                except nx.NetworkXError:
-                    # Handle other graph errors
-                    continue
+                            # Log for debugging
+                            logger.debug(f"Found multi-step path: {identity} -> {target} ({escalation_count} steps)")
+                    
+                    else:
+                        # Single-step escalation
+                        if not self._claim_path('privilege_escalation', path):
+                            continue
+                        attack_path = self._build_attack_path(path)
+                        if attack_path:
+                            self._report_path('privilege_escalation', attack_path)
+            
+            if out_of_budget:
+                logger.warning(
+                    f"Multi-hop search budget exhausted; paths from {identity} were truncated and "
+                    f"{len(searchable) - searched - 1} identities were not searched"
+                )
+                break
         
+        if limited_pairs:
+            logger.info(
+                f"{limited_pairs} identity and target pairs reached the limit of "
+                f"{max_paths_per_pair} paths; further paths between them were not enumerated"
+            )
         logger.info(f"Found {multi_step_count} multi-step attack paths")
     
+    def _search_escalation_paths(
+        self,
+        identities: List[str],
+        targets: Dict[str, int],
+        cutoff: int,
+        adjacency: Dict[str, Tuple[Tuple[str, Optional[str]], ...]],
+        escalation_distance: Dict[str, int],
+        target_distance: Dict[str, int],
+        max_paths_per_target: int = 0,
+        deadline: Optional[float] = None
+    ):
+        """
+        Run the multi-hop escalation search for each identity, in order
+        
+        With analysis_workers above 1 (or 0, for one per CPU), identities are searched
+        in chunks by worker processes that each receive the adjacency list once. Chunks are sized so each
+        worker gets several, since search cost varies widely between identities.
+        Otherwise paths are streamed from the search in this process.
+        
+        Args:
+            identities: Identity node IDs to search from
+            targets: Target node IDs
+            cutoff: Maximum path length in edges
+            adjacency: Result of _escalation_adjacency
+            escalation_distance: Result of _escalation_distances
+            target_distance: Result of _target_distances
+            max_paths_per_target: Paths to find per identity and target (0 = no limit)
+            deadline: time.monotonic() value at which the search gives up, or None
+            
+        Yields:
+            (identity, paths, limited_targets) tuples where paths iterates the
+            (path, escalations) results of _find_escalation_paths_from and
+            limited_targets lists the targets it cut short, once paths is exhausted
+        """
+        workers = self.config.analysis_workers
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or len(identities) <= _IDENTITY_CHUNK_SIZE:
+            for identity in identities:
+                limited_targets = []
+                yield identity, self._find_escalation_paths_from(
+                    identity, targets, cutoff, adjacency, escalation_distance, target_distance,
+                    max_paths_per_target, deadline, limited_targets
+                ), limited_targets
+            return
+        
+        chunk_size = min(_IDENTITY_CHUNK_SIZE, -(-len(identities) // (workers * _CHUNKS_PER_WORKER)))
+        chunks = [
+            identities[i:i + chunk_size]
+            for i in range(0, len(identities), chunk_size)
+        ]
+        logger.info(f"Searching {len(identities)} identities with {workers} worker processes")
+        
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_escalation_search_worker,
+            initargs=(targets, cutoff, adjacency, escalation_distance, target_distance, max_paths_per_target,
+                      deadline)
+        )
+        futures = [executor.submit(_search_escalation_chunk, chunk) for chunk in chunks]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Drop chunks that have not started if the caller stopped early
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+    
+    def _report_path(self, bucket: str, attack_path: AttackPath):
+        """Pass an attack path to the analysis sink, or keep it in its bucket"""
+        self._path_counts[bucket] += 1
+        if self._sink is not None:
+            self._sink(bucket, attack_path)
+        else:
+            self._attack_paths[bucket].append(attack_path)
+    
+    def _bucket_full(self, bucket: str) -> bool:
+        """Check whether an attack path bucket has reached the configured limit"""
+        limit = self.config.analysis_max_paths_per_bucket
+        return bool(limit) and len(self._seen_paths[bucket]) >= limit
+    
+    def _claim_path(self, bucket: str, node_path: List[str]) -> bool:
+        """
+        Reserve a bucket slot for a node path before its AttackPath is built
+        
+        Args:
+            bucket: Attack path bucket name
+            node_path: Node IDs along the path
+            
+        Returns:
+            False if the path was already reported in the bucket or the bucket is full
+        """
+        key = tuple(node_path)
+        seen = self._seen_paths[bucket]
+        if key in seen or self._bucket_full(bucket):
+            return False
+        seen.add(key)
+        return True
+    
+    def _escalation_distances(self, escalation_edges: List[Tuple[str, str, EdgeType, Dict[str, Any]]]) -> Dict[str, int]:
+        """
+        Compute, for every node, the fewest hops needed to traverse an escalation edge
+        
+        A node with an outgoing escalation edge has distance 1; nodes that cannot reach
+        any escalation edge are absent from the result.
+        
+        Args:
+            escalation_edges: (source, target, edge type, edge data) tuples of every
+                escalation edge, as classified by _find_privilege_escalation_paths
+            
+        Returns:
+            Mapping of node ID to hop count
+        """
+        return self._hops_backward_from([source for source, _, _, _ in escalation_edges])
+    
+    def _target_distances(self, targets: List[str]) -> Dict[str, int]:
+        """
+        Compute, for every node, the fewest hops (at least one) needed to reach a target
+        
+        Args:
+            targets: Target node IDs
+            
+        Returns:
+            Mapping of node ID to hop count; nodes that cannot reach a target are absent
+        """
+        predecessors = []
+        for target in targets:
+            predecessors.extend(self.graph.predecessors(target))
+        
+        return self._hops_backward_from(predecessors)
+    
+    def _hops_backward_from(self, seeds: List[str]) -> Dict[str, int]:
+        """
+        Breadth-first search backwards along edges, giving the seed nodes distance 1
+        
+        Args:
+            seeds: Node IDs one hop away from the goal
+            
+        Returns:
+            Mapping of node ID to hop count
+        """
+        distance = {}
+        frontier = []
+        for node_id in seeds:
+            if node_id not in distance:
+                distance[node_id] = 1
+                frontier.append(node_id)
+        
+        hops = 1
+        while frontier:
+            hops += 1
+            next_frontier = []
+            for node_id in frontier:
+                for predecessor in self.graph.predecessors(node_id):
+                    if predecessor not in distance:
+                        distance[predecessor] = hops
+                        next_frontier.append(predecessor)
+            frontier = next_frontier
+        
+        return distance
+    
+    def _escalation_adjacency(
+        self,
+        escalation_types: Set[str],
+        targets: Dict[str, int],
+        target_distance: Dict[str, int]
+    ) -> Dict[str, Tuple[Tuple[str, Optional[str]], ...]]:
+        """
+        Build a compact successor list for every node, tagged with escalation edge types
+        
+        The multi-hop search walks the same edges many times; reading the edge type off
+        a flat tuple is much cheaper than looking it up in each edge's attribute dict.
+        
+        Successors are stored as the graph's own node ID objects. Graphs loaded from
+        JSON hold separate but equal strings for edge endpoints, and sharing one object
+        per node lets the search's set and dict lookups succeed on identity alone.
+        
+        Only nodes that can reach a target are expanded by the search, so the list
+        leaves out every other node and every successor that is neither a target nor
+        able to reach one.
+        
+        Args:
+            escalation_types: Edge type values that count as privilege escalation
+            targets: Target node IDs
+            target_distance: Result of _target_distances
+            
+        Returns:
+            Mapping of node ID to (successor, escalation edge type value or None) pairs
+            in the graph's successor order
+        """
+        node_ids = {node_id: node_id for node_id in self.graph}
+        succ = self.graph.succ
+        adjacency = {}
+        for node_id in target_distance:
+            entries = []
+            for child, edge_data in succ[node_id].items():
+                if child not in target_distance and child not in targets:
+                    continue
+                edge_type = edge_data.get('type')
+                entries.append((node_ids[child], edge_type if edge_type in escalation_types else None))
+            adjacency[node_id] = tuple(entries)
+        return adjacency
+    
+    @staticmethod
+    def _find_escalation_paths_from(
+        source: str,
+        targets: Dict[str, int],
+        cutoff: int,
+        adjacency: Dict[str, Tuple[Tuple[str, Optional[str]], ...]],
+        escalation_distance: Dict[str, int],
+        target_distance: Dict[str, int],
+        max_paths_per_target: int = 0,
+        deadline: Optional[float] = None,
+        limited_targets: Optional[List[str]] = None
+    ):
+        """
+        Enumerate simple paths from source to any target that traverse an escalation edge
+        
+        Produces the same paths, in the same per-target order, as calling
+        nx.all_simple_paths(source, target, cutoff) for each target and keeping the
+        paths with at least one escalation edge, but walks the graph once per source
+        and abandons branches that can no longer reach an escalation edge or a target
+        in time. With max_paths_per_target set, only the first paths to each target are
+        produced; a limit of 1 gives one witness path per target. A target is cut short
+        once a path beyond its share turns up, and the walk ends when every target has
+        been cut short. With a deadline, the walk checks the clock every
+        _DEADLINE_CHECK_STEPS steps and stops once it has passed, so a source whose
+        search finds nothing for a long time still respects the time budget.
+        
+        Args:
+            source: Starting node ID
+            targets: Target node IDs
+            cutoff: Maximum path length in edges
+            adjacency: Result of _escalation_adjacency
+            escalation_distance: Result of _escalation_distances
+            target_distance: Result of _target_distances
+            max_paths_per_target: Paths to produce per target (0 = no limit)
+            deadline: time.monotonic() value at which to stop, or None
+            limited_targets: Optional list that receives each target cut short by
+                max_paths_per_target
+            
+        Yields:
+            (path, escalations) tuples where escalations lists the escalation edge
+            type values along the path in order
+        """
+        path = [source]
+        visited = {source}
+        escalations = []
+        # Escalation edge type taken into each node on the path (None for other edges)
+        hop_escalations = []
+        stack = [iter(adjacency[source])]
+        # Paths found per target, and targets not yet cut short
+        found = {}
+        open_targets = len(targets) - (source in targets)
+        steps = 0
+        
+        while stack:
+            if deadline is not None:
+                steps += 1
+                if steps == _DEADLINE_CHECK_STEPS:
+                    steps = 0
+                    if time.monotonic() > deadline:
+                        return
+            
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                visited.discard(path.pop())
+                if hop_escalations and hop_escalations.pop() is not None:
+                    escalations.pop()
+                continue
+            
+            child, edge_type = entry
+            if child in visited:
+                continue
+            
+            is_escalation = edge_type is not None
+            has_escalation = is_escalation or bool(escalations)
+            
+            if has_escalation and child in targets:
+                count = found.get(child, 0)
+                if not max_paths_per_target or count < max_paths_per_target:
+                    path_escalations = escalations + [edge_type] if is_escalation else list(escalations)
+                    yield path + [child], path_escalations
+                    if max_paths_per_target:
+                        found[child] = count + 1
+                elif count == max_paths_per_target:
+                    # A path beyond the limit exists, so this target really is cut short
+                    found[child] = count + 1
+                    if limited_targets is not None:
+                        limited_targets.append(child)
+                    open_targets -= 1
+                    if not open_targets:
+                        return
+            
+            remaining = cutoff - len(path)
+            if remaining <= 0:
+                continue
+            if not has_escalation and escalation_distance.get(child, remaining + 1) > remaining:
+                continue
+            if target_distance.get(child, remaining + 1) > remaining:
+                continue
+            
+            path.append(child)
+            visited.add(child)
+            if is_escalation:
+                escalations.append(edge_type)
+                hop_escalations.append(edge_type)
+            else:
+                hop_escalations.append(None)
+            stack.append(iter(adjacency[child]))
+    
     def _find_lateral_movement_paths(self):
         """Find paths for lateral movement between projects"""
         logger.info("Finding lateral movement paths")
         
         # Find cross-project access paths
-        project_nodes = [n for n in self.graph.nodes() if n.startswith('project:')]
-        
-        for i, proj1 in enumerate(project_nodes):
-            for proj2 in project_nodes[i+1:]:
-                # Find identities that can access both projects
-                identities_proj1 = set(self.graph.predecessors(proj1))
-                identities_proj2 = set(self.graph.predecessors(proj2))
-                
-                common_identities = identities_proj1 & identities_proj2
-                
-                for identity in common_identities:
-                    # Create a lateral movement path
-                    path = [identity, proj1, identity, proj2]
-                    attack_path = self._build_attack_path(path)
-                    if attack_path:
-                        self._attack_paths['lateral_movement'].append(attack_path)
+        project_nodes = self._nodes_by_prefix.get('project', [])
+        
+        # Group projects by the identities that can access them, so only project
+        # pairs that actually share an identity are visited
+        identity_projects = defaultdict(list)
+        predecessors = self.graph.predecessors
+        for project in project_nodes:
+            for identity in predecessors(project):
+                identity_projects[identity].append(project)
+        
+        for identity, projects in identity_projects.items():
+            if len(projects) < 2:
+                continue
+            if self._bucket_full('lateral_movement'):
+                break
+            
+            for proj1, proj2 in combinations(projects, 2):
+                # Create a lateral movement path from proj1 through the identity to proj2
+                path = [proj1, identity, proj2]
+                if not self._claim_path('lateral_movement', path):
+                    continue
+                attack_path = self._build_attack_path(path, allow_reversed_hops=True)
+                if attack_path:
+                    self._report_path('lateral_movement', attack_path)
     
     def _calculate_risk_scores(self):
         """Calculate risk scores for all nodes"""
         logger.info("Calculating risk scores")
         
-        # Node risk scores
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            
-            # Base risk from node type
-            risk = 0.0
-            
-            # Check if it's a high-value target
-            if node_id.startswith('org:'):
-                risk += 0.3
-            elif node_id.startswith('folder:'):
-                risk += 0.25
-            elif node_id.startswith('project:'):
-                risk += 0.2
-            elif node_id.startswith('sa:'):
-                risk += 0.15
+        # Degree centrality, as nx.degree_centrality computes it, read off the degree
+        # view while scoring instead of building a separate node -> centrality dict
+        num_nodes = self.graph.number_of_nodes()
+        scale = 1.0 / (num_nodes - 1.0) if num_nodes > 1 else None
+        high_risk_count = 0
+        
+        # Node risk scores, walking the prefix buckets so the base risk and role
+        # check are decided once per prefix and the arithmetic runs over arrays
+        degree = self.graph.degree
+        risk_scores = self._risk_scores
+        for prefix, node_ids in self._nodes_by_prefix.items():
+            # Base risk from node type, keyed by the node ID prefix
+            risk = np.full(len(node_ids), _NODE_PREFIX_RISK.get(prefix, 0.0))
             
             # Check for dangerous roles
-            if node_id.startswith('role:'):
-                if any(r in node_id for r in self.config.analysis_dangerous_roles):
-                    risk += 0.5
+            if prefix == 'role':
+                risk += np.fromiter(
+                    (self._is_dangerous_role(node_id) for node_id in node_ids), bool, len(node_ids)
+                ) * 0.5
             
             # Factor in degree centrality
-            centrality = nx.degree_centrality(self.graph).get(node_id, 0)
+            if scale is not None:
+                centrality = np.fromiter((degree[node_id] for node_id in node_ids), float, len(node_ids)) * scale
+            else:
+                centrality = np.ones(len(node_ids))
             risk += centrality * 0.2
             
-            self._risk_scores[node_id] = {
-                'base': risk,
-                'centrality': centrality,
-                'total': min(risk, 1.0)
-            }
+            total = np.minimum(risk, 1.0)
+            high_risk_count += int(np.count_nonzero(total > self.HIGH_RISK_NODE_THRESHOLD))
+            
+            for node_id, node_risk, node_centrality, node_total in zip(
+                node_ids, risk.tolist(), centrality.tolist(), total.tolist()
+            ):
+                risk_scores[node_id] = {
+                    'base': node_risk,
+                    'centrality': node_centrality,
+                    'total': node_total
+                }
+        
+        self._high_risk_node_count = high_risk_count
     
     def _identify_critical_nodes(self):
         """Identify critical nodes in the graph"""
         logger.info("Identifying critical nodes")
         
-        # Use betweenness centrality to find critical nodes
-        betweenness = nx.betweenness_centrality(self.graph)
-        
-        # Sort by centrality
-        sorted_nodes = sorted(betweenness.items(), key=lambda x: x[1], reverse=True)
+        # Use betweenness centrality to find critical nodes; large graphs sample
+        # k pivot nodes instead of computing shortest paths from every node
+        num_nodes = self.graph.number_of_nodes()
+        sample_k = self.config.analysis_centrality_sample_k
+        approximate = bool(sample_k) and num_nodes > self.EXACT_CENTRALITY_MAX_NODES and sample_k < num_nodes
+        if approximate:
+            betweenness = nx.betweenness_centrality(self.graph, k=sample_k, seed=42, normalized=True)
+        elif IGRAPH_AVAILABLE:
+            betweenness = self._igraph_betweenness()
+        else:
+            betweenness = nx.betweenness_centrality(self.graph)
         
-        # Take top nodes
-        for node_id, centrality in sorted_nodes[:20]:
+        # Take top nodes by centrality without sorting the whole graph
+        for node_id, centrality in heapq.nlargest(20, betweenness.items(), key=lambda x: x[1]):
             if centrality > 0.1:  # Threshold for critical
                 self._critical_nodes.append({
                     'node_id': node_id,
                     'centrality': centrality,
+                    'centrality_approximate': approximate,
                     'type': self.graph.nodes[node_id].get('type', 'unknown'),
                     'risk_score': self._risk_scores.get(node_id, {}).get('total', 0)
                 })
     
+    def _igraph_betweenness(self) -> Dict[str, float]:
+        """Compute exact normalized betweenness centrality with igraph's C implementation"""
+        node_ids = list(self.graph.nodes())
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        ig_graph = igraph.Graph(
+            n=len(node_ids),
+            edges=[(index[u], index[v]) for u, v in self.graph.edges()],
+            directed=True
+        )
+        
+        # Same normalization NetworkX applies to directed graphs
+        n = len(node_ids)
+        scale = 1 / ((n - 1) * (n - 2)) if n > 2 else 1
+        return {
+            node_id: value * scale
+            for node_id, value in zip(node_ids, ig_graph.betweenness(directed=True))
+        }
+    
+    def _is_dangerous_role(self, role: str) -> bool:
+        """Check whether a role node ID contains any configured dangerous role"""
+        result = self._role_is_dangerous.get(role)
+        if result is None:
+            matcher = self._dangerous_roles_re
+            result = self._role_is_dangerous[role] = bool(matcher and matcher.search(role))
+        return result
+    
+    @staticmethod
+    def _compile_role_matcher(roles: Iterable[str]) -> Optional[re.Pattern]:
+        """Compile a regex matching any of the given role names, or None if there are none"""
+        if not roles:
+            return None
+        return re.compile('|'.join(re.escape(role) for role in roles))
+    
     def _detect_vulnerabilities(self):
         """Detect security vulnerabilities"""
         logger.info("Detecting vulnerabilities")
         
+        # Dangerous role nodes, matched against the configured roles once per role
+        dangerous_role_nodes = {
+            role for role in self._nodes_by_prefix.get('role', []) if self._is_dangerous_role(role)
+        }
+        
+        successors = self.graph.succ
+        
         # Check for overprivileged service accounts
-        for node_id in self.graph.nodes():
-            if node_id.startswith('sa:'):
-                # Check if SA has dangerous roles
-                roles = [n for n in self.graph.neighbors(node_id) if n.startswith('role:')]
-                dangerous = [r for r in roles if any(d in r for d in self.config.analysis_dangerous_roles)]
-                
-                if dangerous:
-                    self._vulnerabilities.append({
-                        'type': 'overprivileged_service_account',
-                        'severity': 'high',
-                        'resource': node_id,
-                        'details': f"Service account has {len(dangerous)} dangerous roles",
-                        'roles': dangerous
-                    })
+        for node_id in self._nodes_by_prefix.get('sa', []):
+            # Check if SA has dangerous roles
+            dangerous = [r for r in successors[node_id] if r in dangerous_role_nodes]
+            
+            if dangerous:
+                self._vulnerabilities.append({
+                    'type': 'overprivileged_service_account',
+                    'severity': 'high',
+                    'resource': node_id,
+                    'details': f"Service account has {len(dangerous)} dangerous roles",
+                    'roles': dangerous
+                })
         
         # Check for external users with high privileges
-        for node_id in self.graph.nodes():
-            if node_id.startswith('user:') and '@' in node_id:
+        for node_id in self._nodes_by_prefix.get('user', []):
+            if '@' in node_id:
                 # Check if external domain
                 email = node_id.split(':', 1)[1]
-                if not email.endswith(('@example.com', '@yourdomain.com')):  # Replace with actual domains
-                    roles = [n for n in self.graph.neighbors(node_id) if n.startswith('role:')]
-                    dangerous = [r for r in roles if any(d in r for d in self.config.analysis_dangerous_roles)]
+                if not email.endswith(self._internal_suffixes):
+                    dangerous = [r for r in successors[node_id] if r in dangerous_role_nodes]
                     
                     if dangerous:
                         self._vulnerabilities.append({
@@ -387,76 +1194,62 @@ class PathAnalyzer:
                             'roles': dangerous
                         })
     
-    def _build_attack_path(self, node_path: List[str]) -> Optional[AttackPath]:
-        """Build an AttackPath object from a node path"""
+    def _build_attack_path(
+        self,
+        node_path: List[str],
+        description: Optional[str] = None,
+        risk_score: Optional[float] = None,
+        allow_reversed_hops: bool = False
+    ) -> Optional[AttackPath]:
+        """
+        Build an AttackPath object from a node path
+        
+        Args:
+            node_path: Node IDs along the path
+            description: Description to use instead of the generated step-by-step one
+            risk_score: Risk score to use instead of the one derived from the edges
+            allow_reversed_hops: Use the opposite edge for hops with no forward edge,
+                as lateral movement paths step back from a project to its identity
+            
+        Returns:
+            AttackPath, or None if the path has fewer than two nodes
+        """
         if len(node_path) < 2:
             return None
         
-        # Build nodes
-        path_nodes = []
-        for node_id in node_path:
-            node_data = self.graph.nodes[node_id]
-            node = Node(
-                id=node_id,
-                type=NodeType(node_data.get('type', 'user')),
-                name=node_data.get('name', node_id),
-                properties={k: v for k, v in node_data.items() if k not in ['type', 'name']}
-            )
-            path_nodes.append(node)
-        
-        # Build edges with detailed metadata
-        path_edges = []
-        escalation_techniques = []
-        permissions_used = []
-        
-        for i in range(len(node_path) - 1):
-            edge_data = self.graph.get_edge_data(node_path[i], node_path[i + 1])
-            if edge_data:
-                edge_type = EdgeType(edge_data.get('type', 'has_role'))
-                edge = Edge(
-                    source_id=node_path[i],
-                    target_id=node_path[i + 1],
-                    type=edge_type,
-                    properties={k: v for k, v in edge_data.items() if k != 'type'}
-                )
-                path_edges.append(edge)
-                
-                # Extract escalation technique and permissions
-                technique = self._get_escalation_technique(edge_type, edge_data)
-                escalation_techniques.append(technique)
-                
-                # Extract permissions used
-                if 'via_role' in edge_data:
-                    permissions_used.append(edge_data['via_role'])
-                elif 'permission' in edge_data:
-                    permissions_used.append(edge_data['permission'])
-                else:
-                    permissions_used.append(self._infer_permission_from_edge_type(edge_type))
+        # Build nodes, and edges with detailed metadata, from the shared caches
+        node_cache = self._node_cache
+        path_nodes = [node_cache.get(node_id) or self._cache_node(node_id) for node_id in node_path]
         
-        # Calculate risk based on edge types
-        if path_edges:
-            # Check for critical edge types
-            critical_edges = [EdgeType.CAN_IMPERSONATE_SA, EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY]
-            high_edges = [EdgeType.CAN_DEPLOY_FUNCTION_AS, EdgeType.CAN_DEPLOY_CLOUD_RUN_AS, EdgeType.CAN_ACT_AS_VIA_VM]
-            
-            has_critical = any(e.type in critical_edges for e in path_edges)
-            has_high = any(e.type in high_edges for e in path_edges)
-            
-            if has_critical:
-                risk_score = 0.9  # Critical risk
-            elif has_high:
-                risk_score = 0.7  # High risk
-            else:
-                # Calculate average risk for other edges
-                risk_score = sum(e.get_risk_score() for e in path_edges) / len(path_edges)
-                # Ensure medium paths don't get too high risk scores
-                if risk_score > 0.6:
-                    risk_score = 0.5
+        edge_cache = self._edge_cache
+        cached_edges = [
+            edge_cache.get(edge_key) or self._cache_edge(edge_key)
+            for edge_key in zip(node_path, node_path[1:])
+        ]
+        if allow_reversed_hops:
+            cached_edges = [
+                cached or edge_cache.get((target, source)) or self._cache_edge((target, source))
+                for cached, (source, target) in zip(cached_edges, zip(node_path, node_path[1:]))
+            ]
+        # Hops with no usable edge are left out
+        cached_edges = [cached for cached in cached_edges if cached is not None]
+        if cached_edges:
+            path_edges, path_edge_risks, escalation_techniques, permissions_used = map(list, zip(*cached_edges))
         else:
-            risk_score = 0
+            path_edges, path_edge_risks, escalation_techniques, permissions_used = [], [], [], []
+        
+        # Calculate risk based on edge types
+        if risk_score is None:
+            risk_score = self._path_risk_score(path_edges, path_edge_risks)
+        
+        # Display names of the path's ends, read from the shared node metadata
+        node_metadata = self._extract_node_metadata(path_nodes)
+        source_name = node_metadata[0]['label']
+        target_name = node_metadata[-1]['label']
         
         # Build detailed description
-        description = self._build_attack_description(path_nodes, path_edges, escalation_techniques)
+        if description is None:
+            description = self._build_attack_description(source_name, target_name, escalation_techniques)
         
         attack_path = AttackPath(
             source_node=path_nodes[0],
@@ -471,193 +1264,119 @@ class PathAnalyzer:
         attack_path.visualization_metadata = {
             'escalation_techniques': escalation_techniques,
             'permissions_used': permissions_used,
-            'node_metadata': self._extract_node_metadata(path_nodes),
+            'node_metadata': node_metadata,
             'edge_metadata': self._extract_edge_metadata(path_edges),
-            'attack_summary': self._generate_attack_summary(path_nodes, escalation_techniques)
+            'attack_summary': self._generate_attack_summary(source_name, target_name, escalation_techniques)
         }
         
         return attack_path
     
+    def _path_risk_score(self, path_edges: List[Edge], path_edge_risks: List[float]) -> float:
+        """Score a path from its edge types, or from its average edge risk"""
+        if not path_edges:
+            return 0
+        
+        # Check for critical edge types
+        has_critical = any(e.type in self.CRITICAL_PATH_EDGE_TYPES for e in path_edges)
+        has_high = any(e.type in self.HIGH_PATH_EDGE_TYPES for e in path_edges)
+        
+        if has_critical:
+            return 0.9  # Critical risk
+        if has_high:
+            return 0.7  # High risk
+        
+        # Calculate average risk for other edges
+        risk_score = sum(path_edge_risks) / len(path_edge_risks)
+        # Ensure medium paths don't get too high risk scores
+        if risk_score > 0.6:
+            risk_score = 0.5
+        return risk_score
+    
+    def _cache_node(self, node_id: str) -> Node:
+        """Build the shared Node object for a graph node"""
+        node_data = self.graph.nodes[node_id]
+        type_value = node_data.get('type', 'user')
+        node = self._node_cache[node_id] = Node(
+            id=node_id,
+            # Unknown values fall through to NodeType() to raise its usual ValueError
+            type=_NODE_TYPES_BY_VALUE.get(type_value) or NodeType(type_value),
+            name=node_data.get('name', node_id),
+            properties={k: v for k, v in node_data.items() if k not in _NODE_PROPERTY_SKIP_KEYS}
+        )
+        return node
+    
+    def _cache_edge(self, edge_key: Tuple[str, str]) -> Optional[Tuple[Edge, float, Mapping[str, Any], str]]:
+        """
+        Build the shared Edge object for a path hop, with its risk score, escalation
+        technique and permission
+        
+        Args:
+            edge_key: (source, target) node IDs of the hop
+            
+        Returns:
+            Cached (edge, risk score, technique, permission) tuple, or None if the
+            nodes are not connected
+        """
+        source_id, target_id = edge_key
+        edge_data = self.graph.get_edge_data(source_id, target_id)
+        if not edge_data:
+            return None
+        edge = Edge(
+            source_id=source_id,
+            target_id=target_id,
+            type=_edge_type(edge_data.get('type', 'has_role')),
+            properties={k: v for k, v in edge_data.items() if k != 'type'}
+        )
+        
+        # Extract escalation technique and permissions
+        technique = self._get_escalation_technique(edge.type, edge_data)
+        if 'via_role' in edge_data:
+            permission = edge_data['via_role']
+        elif 'permission' in edge_data:
+            permission = edge_data['permission']
+        else:
+            permission = self._infer_permission_from_edge_type(edge.type)
+        
+        cached = self._edge_cache[edge_key] = (edge, edge.get_risk_score(), technique, permission)
+        return cached
+    
     def _calculate_statistics(self) -> Dict[str, Any]:
         """Calculate analysis statistics"""
-        total_paths = sum(len(paths) for paths in self._attack_paths.values())
+        total_paths = sum(self._path_counts.values())
         
         return {
             'total_nodes': self.graph.number_of_nodes(),
             'total_edges': self.graph.number_of_edges(),
             'total_attack_paths': total_paths,
-            'privilege_escalation_paths': len(self._attack_paths.get('privilege_escalation', [])),
-            'lateral_movement_paths': len(self._attack_paths.get('lateral_movement', [])),
+            'privilege_escalation_paths': self._path_counts.get('privilege_escalation', 0),
+            'lateral_movement_paths': self._path_counts.get('lateral_movement', 0),
             'critical_nodes': len(self._critical_nodes),
             'vulnerabilities': len(self._vulnerabilities),
-            'high_risk_nodes': sum(1 for r in self._risk_scores.values() if r.get('total', 0) > 0.7)
+            'high_risk_nodes': self._high_risk_node_count
         }
     
-    def _get_escalation_technique(self, edge_type: EdgeType, edge_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract the escalation technique from edge type and data"""
-        technique_map = {
-            EdgeType.CAN_IMPERSONATE_SA: {
-                'name': 'Service Account Impersonation',
-                'icon': '🔑',
-                'description': 'Generate access tokens for service account',
-                'permission': 'iam.serviceAccounts.getAccessToken'
-            },
-            EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: {
-                'name': 'Service Account Key Creation',
-                'icon': '🗝️',
-                'description': 'Create and download service account keys',
-                'permission': 'iam.serviceAccountKeys.create'
-            },
-            EdgeType.CAN_ACT_AS_VIA_VM: {
-                'name': 'VM ActAs Exploitation',
-                'icon': '💻',
-                'description': 'Deploy VM with service account attached',
-                'permission': 'iam.serviceAccounts.actAs + compute.instances.create'
-            },
-            EdgeType.CAN_DEPLOY_FUNCTION_AS: {
-                'name': 'Cloud Function Deployment',
-                'icon': '⚡',
-                'description': 'Deploy function running as service account',
-                'permission': 'cloudfunctions.functions.create + iam.serviceAccounts.actAs'
-            },
-            EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: {
-                'name': 'Cloud Run Deployment',
-                'icon': '🏃',
-                'description': 'Deploy Cloud Run service with SA',
-                'permission': 'run.services.create + iam.serviceAccounts.actAs'
-            },
-            EdgeType.CAN_TRIGGER_BUILD_AS: {
-                'name': 'Cloud Build Trigger',
-                'icon': '🔨',
-                'description': 'Trigger build running as service account',
-                'permission': 'cloudbuild.builds.create'
-            },
-            EdgeType.CAN_LOGIN_TO_VM: {
-                'name': 'VM SSH Access',
-                'icon': '🖥️',
-                'description': 'SSH into VM and access metadata service',
-                'permission': 'compute.instances.osLogin'
-            },
-            EdgeType.CAN_DEPLOY_GKE_POD_AS: {
-                'name': 'GKE Pod Deployment',
-                'icon': '☸️',
-                'description': 'Deploy pod in GKE with service account',
-                'permission': 'container.pods.create + iam.serviceAccounts.actAs'
-            },
-            EdgeType.CAN_SATISFY_IAM_CONDITION: {
-                'name': 'IAM Condition Bypass',
-                'icon': '🔓',
-                'description': 'Satisfy IAM conditions to gain access',
-                'permission': 'Varies by condition'
-            },
-            EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: {
-                'name': 'External Identity Impersonation',
-                'icon': '🌐',
-                'description': 'External identity can impersonate service account',
-                'permission': 'iam.workloadIdentityPools.providers.use'
-            },
-            EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: {
-                'name': 'Workload Identity Hijacking',
-                'icon': '🎭',
-                'description': 'Hijack GKE workload identity',
-                'permission': 'container.pods.create'
-            },
-            EdgeType.CAN_MODIFY_CUSTOM_ROLE: {
-                'name': 'Custom Role Modification',
-                'icon': '✏️',
-                'description': 'Modify custom role to add permissions',
-                'permission': 'iam.roles.update'
-            },
-            EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: {
-                'name': 'Default Service Account Usage',
-                'icon': '🤖',
-                'description': 'Launch resources using default service account',
-                'permission': 'Varies by service'
-            },
-            EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: {
-                'name': 'Service Account Attachment',
-                'icon': '📎',
-                'description': 'Attach service account to resources',
-                'permission': 'iam.serviceAccounts.actAs'
-            },
-            EdgeType.CAN_UPDATE_METADATA: {
-                'name': 'Metadata Manipulation',
-                'icon': '📝',
-                'description': 'Update instance metadata',
-                'permission': 'compute.instances.setMetadata'
-            },
-            EdgeType.CAN_ASSIGN_CUSTOM_ROLE: {
-                'name': 'Custom Role Assignment',
-                'icon': '🎯',
-                'description': 'Assign custom roles with dangerous permissions',
-                'permission': 'resourcemanager.projects.setIamPolicy'
-            },
-            EdgeType.HAS_TAG_BINDING_ESCALATION: {
-                'name': 'Tag-based Escalation',
-                'icon': '🏷️',
-                'description': 'Use tag bindings for privilege escalation',
-                'permission': 'resourcemanager.tagBindings.create'
-            },
-            EdgeType.CAN_SSH_AND_IMPERSONATE: {
-                'name': 'SSH + Impersonation',
-                'icon': '🔐',
-                'description': 'SSH access combined with impersonation',
-                'permission': 'compute.instances.osLogin + iam.serviceAccounts.getAccessToken'
-            },
-            EdgeType.HAS_ESCALATED_PRIVILEGE: {
-                'name': 'Confirmed Privilege Escalation',
-                'icon': '⚠️',
-                'description': 'Privilege escalation detected in audit logs',
-                'permission': 'N/A - detected from logs'
-            },
-            EdgeType.HAS_ROLE: {
-                'name': 'Role Assignment',
-                'icon': '👤',
-                'description': 'Has IAM role granting permissions',
-                'permission': edge_data.get('via_role', edge_data.get('role', 'IAM role'))
-            },
-            EdgeType.MEMBER_OF: {
-                'name': 'Group Membership',
-                'icon': '👥',
-                'description': 'Member of group',
-                'permission': 'N/A'
-            },
-            EdgeType.CAN_ADMIN: {
-                'name': 'Administrative Access',
-                'icon': '👑',
-                'description': 'Full administrative control',
-                'permission': 'resourcemanager.projects.setIamPolicy'
-            },
-            EdgeType.CAN_WRITE: {
-                'name': 'Write Access',
-                'icon': '✍️',
-                'description': 'Can modify resources',
-                'permission': 'Varies by resource'
-            },
-            EdgeType.CAN_READ: {
-                'name': 'Read Access',
-                'icon': '👁️',
-                'description': 'Can view resources',
-                'permission': 'Varies by resource'
-            },
-            EdgeType.CAN_IMPERSONATE: {
-                'name': 'General Impersonation',
-                'icon': '🔑',
-                'description': 'Can impersonate identity',
-                'permission': 'iam.serviceAccounts.getAccessToken'
-            }
-        }
+    def _get_escalation_technique(self, edge_type: EdgeType, edge_data: Dict[str, Any]) -> Mapping[str, Any]:
+        """Extract the escalation technique from edge type and data, read-only as every path through the edge shares it"""
+        # Edges without per-edge role details share one technique dict per edge type
+        if 'via_role' not in edge_data and edge_type != EdgeType.HAS_ROLE:
+            shared = _SHARED_ESCALATION_TECHNIQUES.get(edge_type)
+            if shared is not None:
+                return shared
         
         # Get the technique from the map, or create a sensible default
-        technique = technique_map.get(edge_type, {
-            'name': edge_type.value.replace('_', ' ').replace('can ', 'Can ').replace('has ', 'Has ').title(),
-            'icon': '🔐',
-            'description': f'{edge_type.value.replace("_", " ").title()} capability',
-            'permission': edge_data.get('permission', edge_data.get('via_role', self._infer_permission_from_edge_type(edge_type)))
-        })
-        
-        # Make a copy to avoid modifying the original
-        technique = technique.copy()
+        technique = _ESCALATION_TECHNIQUES.get(edge_type)
+        if technique is None:
+            technique = {
+                'name': edge_type.value.replace('_', ' ').replace('can ', 'Can ').replace('has ', 'Has ').title(),
+                'icon': '🔐',
+                'description': f'{edge_type.value.replace("_", " ").title()} capability',
+                'permission': edge_data.get('permission', edge_data.get('via_role', self._infer_permission_from_edge_type(edge_type)))
+            }
+        else:
+            # Make a copy to avoid modifying the shared map
+            technique = technique.copy()
+            if edge_type == EdgeType.HAS_ROLE:
+                technique['permission'] = edge_data.get('via_role', edge_data.get('role', 'IAM role'))
         
         # Add edge-specific data
         technique['edge_type'] = edge_type.value
@@ -667,192 +1386,122 @@ class PathAnalyzer:
             if technique['permission'] in ['IAM role', 'Unknown role']:
                 technique['permission'] = edge_data['via_role']
         
-        return technique
+        return MappingProxyType(technique)
     
     def _infer_permission_from_edge_type(self, edge_type: EdgeType) -> str:
         """Infer the GCP permission from edge type"""
-        permission_map = {
-            EdgeType.CAN_IMPERSONATE_SA: 'iam.serviceAccounts.getAccessToken',
-            EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: 'iam.serviceAccountKeys.create',
-            EdgeType.CAN_ACT_AS_VIA_VM: 'iam.serviceAccounts.actAs',
-            EdgeType.CAN_DEPLOY_FUNCTION_AS: 'cloudfunctions.functions.create',
-            EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: 'run.services.create',
-            EdgeType.CAN_TRIGGER_BUILD_AS: 'cloudbuild.builds.create',
-            EdgeType.CAN_LOGIN_TO_VM: 'compute.instances.osLogin',
-            EdgeType.CAN_ADMIN: 'resourcemanager.projects.setIamPolicy',
-            EdgeType.CAN_WRITE: 'storage.objects.create',
-            EdgeType.CAN_READ: 'storage.objects.get',
-            EdgeType.CAN_DEPLOY_GKE_POD_AS: 'container.pods.create',
-            EdgeType.CAN_SATISFY_IAM_CONDITION: 'iam.conditions.check',
-            EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: 'iam.workloadIdentityPools.providers.use',
-            EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: 'container.pods.create',
-            EdgeType.CAN_MODIFY_CUSTOM_ROLE: 'iam.roles.update',
-            EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: 'compute.instances.create',
-            EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: 'iam.serviceAccounts.actAs',
-            EdgeType.CAN_UPDATE_METADATA: 'compute.instances.setMetadata',
-            EdgeType.CAN_ASSIGN_CUSTOM_ROLE: 'resourcemanager.projects.setIamPolicy',
-            EdgeType.HAS_TAG_BINDING_ESCALATION: 'resourcemanager.tagBindings.create',
-            EdgeType.CAN_SSH_AND_IMPERSONATE: 'compute.instances.osLogin',
-            EdgeType.HAS_ESCALATED_PRIVILEGE: 'N/A - detected from logs',
-            EdgeType.HAS_ROLE: 'iam.roles.get',
-            EdgeType.MEMBER_OF: 'N/A - group membership',
-            EdgeType.CAN_IMPERSONATE: 'iam.serviceAccounts.getAccessToken'
-        }
-        return permission_map.get(edge_type, f'{edge_type.value.lower().replace("_", ".")}')
+        return _INFERRED_PERMISSIONS[edge_type]
     
-    def _extract_node_metadata(self, nodes: List[Node]) -> List[Dict[str, Any]]:
+    def _extract_node_metadata(self, nodes: List[Node]) -> List[Mapping[str, Any]]:
         """Extract visualization metadata for nodes"""
-        metadata = []
-        for node in nodes:
-            node_meta = {
-                'id': node.id,
-                'label': node.get_display_name(),
-                'type': node.type.value,
-                'icon': self._get_node_icon(node.type),
-                'color': self._get_node_color(node.type),
-                'risk_level': self._get_node_risk_level(node),
-                'properties': node.properties
-            }
-            metadata.append(node_meta)
-        return metadata
+        metadata_cache = self._node_metadata_cache
+        return [metadata_cache.get(node.id) or self._cache_node_metadata(node) for node in nodes]
     
-    def _extract_edge_metadata(self, edges: List[Edge]) -> List[Dict[str, Any]]:
+    def _extract_edge_metadata(self, edges: List[Edge]) -> List[Mapping[str, Any]]:
         """Extract visualization metadata for edges"""
-        metadata = []
-        for edge in edges:
-            edge_meta = {
-                'source': edge.source_id,
-                'target': edge.target_id,
-                'type': edge.type.value,
-                'label': self._get_edge_label(edge),
-                'color': self._get_edge_color(edge.type),
-                'risk_score': edge.get_risk_score(),
-                'properties': edge.properties
-            }
-            metadata.append(edge_meta)
-        return metadata
+        metadata_cache = self._edge_metadata_cache
+        return [
+            metadata_cache.get((edge.source_id, edge.target_id)) or self._cache_edge_metadata(edge)
+            for edge in edges
+        ]
+    
+    def _cache_node_metadata(self, node: Node) -> Mapping[str, Any]:
+        """Build the shared, read-only visualization metadata for a node"""
+        node_meta = self._node_metadata_cache[node.id] = MappingProxyType({
+            'id': node.id,
+            'label': node.get_display_name(),
+            'type': node.type.value,
+            'icon': self._get_node_icon(node.type),
+            'color': self._get_node_color(node.type),
+            'risk_level': self._get_node_risk_level(node),
+            'properties': MappingProxyType(node.properties)
+        })
+        return node_meta
+    
+    def _cache_edge_metadata(self, edge: Edge) -> Mapping[str, Any]:
+        """Build the shared, read-only visualization metadata for an edge"""
+        edge_key = (edge.source_id, edge.target_id)
+        cached = self._edge_cache.get(edge_key)
+        edge_meta = self._edge_metadata_cache[edge_key] = MappingProxyType({
+            'source': edge.source_id,
+            'target': edge.target_id,
+            'type': edge.type.value,
+            'label': self._get_edge_label(edge),
+            'color': self._get_edge_color(edge.type),
+            # Path edges come from _edge_cache, which already holds their risk score
+            'risk_score': cached[1] if cached is not None else edge.get_risk_score(),
+            'properties': MappingProxyType(edge.properties)
+        })
+        return edge_meta
     
     def _get_node_icon(self, node_type: NodeType) -> str:
         """Get icon for node type"""
-        icon_map = {
-            NodeType.USER: '👤',
-            NodeType.SERVICE_ACCOUNT: '🤖',
-            NodeType.GROUP: '👥',
-            NodeType.PROJECT: '📁',
-            NodeType.FOLDER: '📂',
-            NodeType.ORGANIZATION: '🏢',
-            NodeType.ROLE: '🎭',
-            NodeType.CUSTOM_ROLE: '🎨',
-            NodeType.RESOURCE: '📦',
-            NodeType.BUCKET: '🪣',
-            NodeType.INSTANCE: '💻',
-            NodeType.FUNCTION: '⚡',
-            NodeType.SECRET: '🔐',
-            NodeType.KMS_KEY: '🔑',
-            NodeType.CLOUD_RUN_SERVICE: '🏃',
-            NodeType.GKE_CLUSTER: '☸️'
-        }
-        return icon_map.get(node_type, '📍')
+        return _NODE_ICONS.get(node_type, '📍')
     
     def _get_node_color(self, node_type: NodeType) -> str:
         """Get color for node type"""
-        color_map = {
-            NodeType.USER: '#4285F4',
-            NodeType.SERVICE_ACCOUNT: '#34A853',
-            NodeType.GROUP: '#FBBC04',
-            NodeType.PROJECT: '#EA4335',
-            NodeType.FOLDER: '#FF6D00',
-            NodeType.ORGANIZATION: '#9C27B0',
-            NodeType.ROLE: '#757575',
-            NodeType.CUSTOM_ROLE: '#616161',
-            NodeType.RESOURCE: '#00ACC1'
-        }
-        return color_map.get(node_type, '#9E9E9E')
+        return _NODE_COLORS.get(node_type, '#9E9E9E')
     
     def _get_node_risk_level(self, node: Node) -> str:
         """Get risk level for node"""
-        risk_score = node.get_risk_score()
-        if risk_score >= 0.8:
-            return 'critical'
-        elif risk_score >= 0.6:
-            return 'high'
-        elif risk_score >= 0.4:
-            return 'medium'
-        elif risk_score >= 0.2:
-            return 'low'
-        return 'info'
+        return _RISK_LEVELS[bisect_right(_RISK_LEVEL_THRESHOLDS, node.get_risk_score())]
     
     def _get_edge_label(self, edge: Edge) -> str:
         """Get display label for edge"""
-        label_map = {
-            EdgeType.CAN_IMPERSONATE_SA: 'impersonate',
-            EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY: 'create key',
-            EdgeType.CAN_ACT_AS_VIA_VM: 'actAs VM',
-            EdgeType.CAN_DEPLOY_FUNCTION_AS: 'deploy function',
-            EdgeType.CAN_DEPLOY_CLOUD_RUN_AS: 'deploy run',
-            EdgeType.CAN_TRIGGER_BUILD_AS: 'trigger build',
-            EdgeType.CAN_LOGIN_TO_VM: 'SSH access',
-            EdgeType.HAS_ROLE: edge.properties.get('via_role', edge.properties.get('role', 'has role')),
-            EdgeType.CAN_ADMIN: 'admin',
-            EdgeType.CAN_WRITE: 'write',
-            EdgeType.CAN_READ: 'read',
-            EdgeType.CAN_DEPLOY_GKE_POD_AS: 'deploy pod',
-            EdgeType.CAN_SATISFY_IAM_CONDITION: 'satisfy condition',
-            EdgeType.EXTERNAL_PRINCIPAL_CAN_IMPERSONATE: 'external impersonate',
-            EdgeType.CAN_HIJACK_WORKLOAD_IDENTITY: 'hijack workload',
-            EdgeType.CAN_MODIFY_CUSTOM_ROLE: 'modify role',
-            EdgeType.CAN_LAUNCH_AS_DEFAULT_SA: 'use default SA',
-            EdgeType.CAN_ATTACH_SERVICE_ACCOUNT: 'attach SA',
-            EdgeType.CAN_UPDATE_METADATA: 'update metadata',
-            EdgeType.CAN_ASSIGN_CUSTOM_ROLE: 'assign role',
-            EdgeType.HAS_TAG_BINDING_ESCALATION: 'tag escalation',
-            EdgeType.CAN_SSH_AND_IMPERSONATE: 'SSH + impersonate',
-            EdgeType.HAS_ESCALATED_PRIVILEGE: 'escalated',
-            EdgeType.MEMBER_OF: 'member of',
-            EdgeType.CAN_IMPERSONATE: 'impersonate'
-        }
-        
         # For HAS_ROLE edges, try to extract the actual role name
         if edge.type == EdgeType.HAS_ROLE:
-            role = edge.properties.get('via_role', edge.properties.get('role'))
-            if role:
-                # Clean up role name for display
-                if role.startswith('roles/'):
-                    return role[6:]  # Remove 'roles/' prefix
-                return role
+            properties = edge.properties
+            # Only look at 'role' when 'via_role' is absent
+            role = properties['via_role'] if 'via_role' in properties else properties.get('role', 'has role')
+            # Clean up role name for display
+            if role and role.startswith('roles/'):
+                return role[6:]  # Remove 'roles/' prefix
+            return role
         
-        return label_map.get(edge.type, edge.type.value.replace('_', ' ').lower())
+        return _EDGE_LABELS[edge.type]
     
     def _get_edge_color(self, edge_type: EdgeType) -> str:
         """Get color for edge type"""
-        if edge_type in self.ESCALATION_EDGE_TYPES:
-            return '#FF0000'  # Red for escalation
-        
-        color_map = {
-            EdgeType.HAS_ROLE: '#757575',
-            EdgeType.MEMBER_OF: '#9E9E9E',
-            EdgeType.CAN_ADMIN: '#FF5722',
-            EdgeType.CAN_WRITE: '#FF9800',
-            EdgeType.CAN_READ: '#FFC107'
-        }
-        return color_map.get(edge_type, '#BDBDBD')
+        return self.EDGE_COLORS.get(edge_type, '#BDBDBD')
     
-    def _build_attack_description(self, nodes: List[Node], edges: List[Edge], techniques: List[Dict[str, Any]]) -> str:
+    def _build_attack_description(self, source: str, target: str, techniques: List[Mapping[str, Any]]) -> str:
         """Build detailed attack description"""
-        parts = [f"Attack path from {nodes[0].get_display_name()} to {nodes[-1].get_display_name()}"]
+        parts = [f"Attack path from {source} to {target}"]
         
         for i, technique in enumerate(techniques):
             parts.append(f"Step {i+1}: {technique['name']} ({technique['permission']})")
         
         return " | ".join(parts)
     
-    def _generate_attack_summary(self, nodes: List[Node], techniques: List[Dict[str, Any]]) -> str:
+    def _generate_attack_summary(self, source: str, target: str, techniques: List[Mapping[str, Any]]) -> str:
         """Generate concise attack summary"""
-        source = nodes[0].get_display_name()
-        target = nodes[-1].get_display_name()
         technique_names = [t['name'] for t in techniques]
         
         if len(technique_names) == 1:
             return f"{source} can reach {target} via {technique_names[0]}"
         else:
-            return f"{source} can reach {target} via {len(technique_names)} steps: {' → '.join(technique_names)}" 
\ No newline at end of file
+            return f"{source} can reach {target} via {len(technique_names)} steps: {' → '.join(technique_names)}" 
+
+
+# Search inputs shared by every task in a multi-hop search worker process
+_worker_search_args = None
+
+
+def _init_escalation_search_worker(targets, cutoff, adjacency, escalation_distance, target_distance,
+                                   max_paths_per_target, deadline):
+    """Store the multi-hop search inputs once per worker process"""
+    global _worker_search_args
+    _worker_search_args = (targets, cutoff, adjacency, escalation_distance, target_distance, max_paths_per_target,
+                           deadline)
+
+
+def _search_escalation_chunk(
+    identities: List[str]
+) -> List[Tuple[str, List[Tuple[List[str], List[str]]], List[str]]]:
+    """Run the multi-hop escalation search for a chunk of identities in a worker process"""
+    results = []
+    for identity in identities:
+        limited_targets = []
+        paths = list(PathAnalyzer._find_escalation_paths_from(identity, *_worker_search_args, limited_targets))
+        results.append((identity, paths, limited_targets))
+    return results
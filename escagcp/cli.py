@@ -113,14 +113,12 @@ def build_graph(config, input, output):
     """Build graph from collected data"""
     try:
         # Find latest collection file
-        input_path = Path(input)
-        collection_files = list(input_path.glob('escagcp_complete_*.json'))
+        latest_file = _latest_file(input, 'escagcp_complete_', '.json')
         
-        if not collection_files:
+        if latest_file is None:
             click.echo("No collection data found. Run 'collect' first.")
             sys.exit(1)
         
-        latest_file = max(collection_files, key=lambda f: f.stat().st_mtime)
         logger.info(f"Loading data from: {latest_file}")
         
         # Load data
@@ -187,27 +185,24 @@ def analyze(config, graph, output, format, visualize_attack_paths):
                 if '*' in graph:
                     # It's a pattern
                     pattern = graph
+                    graph_file = _latest_matching_file(pattern)
                 else:
                     # Maybe it's a directory
                     pattern = str(Path(graph) / 'escagcp_graph_*.json')
+                    graph_file = _latest_file(graph, 'escagcp_graph_', '.json')
                 
-                graph_files = list(Path('.').glob(pattern))
-                if not graph_files:
+                if graph_file is None:
                     click.echo(f"No graph files found matching pattern: {pattern}")
                     sys.exit(1)
                 
-                # Use the latest file
-                graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
                 click.echo(f"Using latest graph file: {graph_file}")
         else:
             # No graph specified, look in default location
-            graph_files = list(Path('graph').glob('escagcp_graph_*.json'))
-            if not graph_files:
+            graph_file = _latest_file('graph', 'escagcp_graph_', '.json')
+            if graph_file is None:
                 click.echo("No graph files found. Run 'escagcp build-graph' first.")
                 sys.exit(1)
             
-            # Use the latest file
-            graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
             click.echo(f"Using latest graph file: {graph_file}")
         
         # Load graph
@@ -343,27 +338,24 @@ def visualize(config, graph, output, viz_type, format):
                 if '*' in graph:
                     # It's a pattern
                     pattern = graph
+                    graph_file = _latest_matching_file(pattern)
                 else:
                     # Maybe it's a directory
                     pattern = str(Path(graph) / 'escagcp_graph_*.json')
+                    graph_file = _latest_file(graph, 'escagcp_graph_', '.json')
                 
-                graph_files = list(Path('.').glob(pattern))
-                if not graph_files:
+                if graph_file is None:
                     click.echo(f"No graph files found matching pattern: {pattern}")
                     sys.exit(1)
                 
-                # Use the latest file
-                graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
                 click.echo(f"Using latest graph file: {graph_file}")
         else:
             # No graph specified, look in default location
-            graph_files = list(Path('graph').glob('escagcp_graph_*.json'))
-            if not graph_files:
+            graph_file = _latest_file('graph', 'escagcp_graph_', '.json')
+            if graph_file is None:
                 click.echo("No graph files found. Run 'escagcp build-graph' first.")
                 sys.exit(1)
             
-            # Use the latest file
-            graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
             click.echo(f"Using latest graph file: {graph_file}")
         
         # Load graph and analysis
@@ -402,15 +394,13 @@ def visualize(config, graph, output, viz_type, format):
                 visualizer.create_full_graph(str(output_file))
             
             elif viz_type == 'attack-paths':
-                # Try to load existing analysis results first
-                findings_files = list(Path('findings').glob('escagcp_analysis_*.json'))
+                # Try to load existing analysis results first, from the latest findings file
+                latest_findings = _latest_file('findings', 'escagcp_analysis_', '.json')
                 attack_paths = []
                 risk_scores = {}
                 critical_nodes = []
                 
-                if findings_files:
-                    # Use the latest findings file
-                    latest_findings = max(findings_files, key=lambda f: f.stat().st_mtime)
+                if latest_findings is not None:
                     click.echo(f"Loading analysis from: {latest_findings}")
                     
                     with open(latest_findings, 'r') as f:
@@ -465,7 +455,7 @@ def visualize(config, graph, output, viz_type, format):
                             }
                             # Preserve visualization metadata if available
                             if hasattr(path, 'visualization_metadata') and path.visualization_metadata:
-                                path_dict['visualization_metadata'] = path.visualization_metadata
+                                path_dict['visualization_metadata'] = path.get_visualization_metadata()
                             if hasattr(path, 'description') and path.description:
                                 path_dict['description'] = path.description
                             attack_paths.append(path_dict)
@@ -482,15 +472,13 @@ def visualize(config, graph, output, viz_type, format):
                 )
             
             elif viz_type == 'risk':
-                # Try to load existing analysis results first
-                findings_files = list(Path('findings').glob('escagcp_analysis_*.json'))
+                # Try to load existing analysis results first, from the latest findings file
+                latest_findings = _latest_file('findings', 'escagcp_analysis_', '.json')
                 attack_paths = []
                 risk_scores = {}
                 critical_nodes = []
                 
-                if findings_files:
-                    # Use the latest findings file
-                    latest_findings = max(findings_files, key=lambda f: f.stat().st_mtime)
+                if latest_findings is not None:
                     click.echo(f"Loading analysis from: {latest_findings}")
                     
                     with open(latest_findings, 'r') as f:
@@ -545,7 +533,7 @@ def visualize(config, graph, output, viz_type, format):
                             }
                             # Preserve visualization metadata if available
                             if hasattr(path, 'visualization_metadata') and path.visualization_metadata:
-                                path_dict['visualization_metadata'] = path.visualization_metadata
+                                path_dict['visualization_metadata'] = path.get_visualization_metadata()
                             if hasattr(path, 'description') and path.description:
                                 path_dict['description'] = path.description
                             attack_paths.append(path_dict)
@@ -616,27 +604,24 @@ def simulate(config, graph, action, member, role, resource, new_role):
                 if '*' in graph:
                     # It's a pattern
                     pattern = graph
+                    graph_file = _latest_matching_file(pattern)
                 else:
                     # Maybe it's a directory
                     pattern = str(Path(graph) / 'escagcp_graph_*.json')
+                    graph_file = _latest_file(graph, 'escagcp_graph_', '.json')
                 
-                graph_files = list(Path('.').glob(pattern))
-                if not graph_files:
+                if graph_file is None:
                     click.echo(f"No graph files found matching pattern: {pattern}")
                     sys.exit(1)
                 
-                # Use the latest file
-                graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
                 click.echo(f"Using latest graph file: {graph_file}")
         else:
             # No graph specified, look in default location
-            graph_files = list(Path('graph').glob('escagcp_graph_*.json'))
-            if not graph_files:
+            graph_file = _latest_file('graph', 'escagcp_graph_', '.json')
+            if graph_file is None:
                 click.echo("No graph files found. Run 'escagcp build-graph' first.")
                 sys.exit(1)
             
-            # Use the latest file
-            graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
             click.echo(f"Using latest graph file: {graph_file}")
         
         # Load graph
@@ -754,27 +739,24 @@ def query(config, graph, source, target, query_type):
                 if '*' in graph:
                     # It's a pattern
                     pattern = graph
+                    graph_file = _latest_matching_file(pattern)
                 else:
                     # Maybe it's a directory
                     pattern = str(Path(graph) / 'escagcp_graph_*.json')
+                    graph_file = _latest_file(graph, 'escagcp_graph_', '.json')
                 
-                graph_files = list(Path('.').glob(pattern))
-                if not graph_files:
+                if graph_file is None:
                     click.echo(f"No graph files found matching pattern: {pattern}")
                     sys.exit(1)
                 
-                # Use the latest file
-                graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
                 click.echo(f"Using latest graph file: {graph_file}")
         else:
             # No graph specified, look in default location
-            graph_files = list(Path('graph').glob('escagcp_graph_*.json'))
-            if not graph_files:
+            graph_file = _latest_file('graph', 'escagcp_graph_', '.json')
+            if graph_file is None:
                 click.echo("No graph files found. Run 'escagcp build-graph' first.")
                 sys.exit(1)
             
-            # Use the latest file
-            graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
             click.echo(f"Using latest graph file: {graph_file}")
         
         # Load graph
@@ -876,6 +858,50 @@ def query(config, graph, source, target, query_type):
         sys.exit(1)
 
 
+def _latest_file(directory: str, prefix: str, suffix: str) -> Optional[str]:
+    """
+    Find the most recently modified file named prefix*suffix in a directory.
+    
+    A single os.scandir pass filters entries by name without building a Path
+    per entry, then stats only the matches. Matches that cannot be stat'ed,
+    such as dangling symlinks, are skipped.
+    
+    Returns:
+        Path of the latest file, or None if the directory has no match
+    """
+    latest_path = None
+    latest_mtime = None
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if latest_mtime is None or mtime > latest_mtime:
+                    latest_path = entry.path
+                    latest_mtime = mtime
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return latest_path
+
+
+def _latest_matching_file(pattern: str) -> Optional[str]:
+    """
+    Find the most recently modified file matching a glob pattern.
+    
+    Returns:
+        Path of the latest file, or None if nothing matches
+    """
+    files = glob.glob(pattern, recursive=True)
+    if not files:
+        return None
+    return max(files, key=os.path.getmtime)
+
+
 def _save_data_for_react_frontend(graph_file: str, analysis_file: str) -> bool:
     """
     Save graph and analysis data in the format expected by the React frontend.
@@ -1269,27 +1295,24 @@ def export(config, graph, output):
                 if '*' in graph:
                     # It's a pattern
                     pattern = graph
+                    graph_file = _latest_matching_file(pattern)
                 else:
                     # Maybe it's a directory
                     pattern = str(Path(graph) / 'escagcp_graph_*.json')
+                    graph_file = _latest_file(graph, 'escagcp_graph_', '.json')
                 
-                graph_files = list(Path('.').glob(pattern))
-                if not graph_files:
+                if graph_file is None:
                     click.echo(f"No graph files found matching pattern: {pattern}")
                     sys.exit(1)
                 
-                # Use the latest file
-                graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
                 click.echo(f"Using latest graph file: {graph_file}")
         else:
             # No graph specified, look in default location
-            graph_files = list(Path('graph').glob('escagcp_graph_*.json'))
-            if not graph_files:
+            graph_file = _latest_file('graph', 'escagcp_graph_', '.json')
+            if graph_file is None:
                 click.echo("No graph files found. Run 'escagcp build-graph' first.")
                 sys.exit(1)
             
-            # Use the latest file
-            graph_file = max(graph_files, key=lambda f: f.stat().st_mtime)
             click.echo(f"Using latest graph file: {graph_file}")
         
         # Load graph
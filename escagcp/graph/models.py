@@ -2,9 +2,23 @@
 Graph models for nodes and edges
 """
 
+import sys
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Mapping, Optional, List
+
+
+# Attack paths build Node and Edge objects in bulk; slot them where dataclasses
+# support it (Python 3.10+) to drop the per-instance __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _plain_metadata(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    """Copy a read-only node or edge metadata entry into a plain dict, ready for JSON"""
+    plain = dict(entry)
+    if 'properties' in plain:
+        plain['properties'] = dict(plain['properties'])
+    return plain
 
 
 class NodeType(Enum):
@@ -85,7 +99,7 @@ class EdgeType(Enum):
     HAS_ACCESSED = "has_accessed"  # Confirmed from audit logs
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Node:
     """
     Represents a node in the GCP graph
@@ -239,7 +253,7 @@ class Node:
         return min(score, 1.0)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Edge:
     """
     Represents an edge (relationship) in the GCP graph
@@ -457,17 +471,34 @@ class AttackPath:
         }
         
         if self.visualization_metadata:
-            result['visualization_metadata'] = self.visualization_metadata
+            result['visualization_metadata'] = self.get_visualization_metadata()
             
         return result
     
+    def get_visualization_metadata(self) -> Dict[str, Any]:
+        """Get visualization metadata with techniques and node and edge entries as plain dicts, ready for JSON"""
+        if not self.visualization_metadata:
+            return {}
+        
+        metadata = dict(self.visualization_metadata)
+        if 'escalation_techniques' in metadata:
+            metadata['escalation_techniques'] = [dict(t) for t in metadata['escalation_techniques']]
+        for key in ('node_metadata', 'edge_metadata'):
+            if key in metadata:
+                metadata[key] = [_plain_metadata(entry) for entry in metadata[key]]
+        return metadata
+    
     def get_path_string(self) -> str:
         """Get a string representation of the path"""
         path_parts = []
         for i, edge in enumerate(self.path_edges):
             if i == 0:
                 path_parts.append(self.path_nodes[i].get_display_name())
-            path_parts.append(f"--[{edge.type.value}]-->")
+            # Hops that follow an edge backwards, as in lateral movement paths
+            if edge.source_id != self.path_nodes[i].id and edge.target_id == self.path_nodes[i].id:
+                path_parts.append(f"<--[{edge.type.value}]--")
+            else:
+                path_parts.append(f"--[{edge.type.value}]-->")
             path_parts.append(self.path_nodes[i + 1].get_display_name())
         return " ".join(path_parts)
     
@@ -477,9 +508,9 @@ class AttackPath:
             return {}
             
         return {
-            'nodes': self.visualization_metadata.get('node_metadata', []),
-            'edges': self.visualization_metadata.get('edge_metadata', []),
-            'techniques': self.visualization_metadata.get('escalation_techniques', []),
+            'nodes': [_plain_metadata(n) for n in self.visualization_metadata.get('node_metadata', [])],
+            'edges': [_plain_metadata(e) for e in self.visualization_metadata.get('edge_metadata', [])],
+            'techniques': [dict(t) for t in self.visualization_metadata.get('escalation_techniques', [])],
             'permissions': self.visualization_metadata.get('permissions_used', []),
             'summary': self.visualization_metadata.get('attack_summary', ''),
             'risk_score': self.risk_score,
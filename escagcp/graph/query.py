@@ -12,6 +12,89 @@ from ..utils import get_logger, Config
 
 logger = get_logger(__name__)
 
+# Edge type lookup by raw value, avoiding Enum construction in per-edge loops
+_EDGE_TYPES_BY_VALUE = {edge_type.value: edge_type for edge_type in EdgeType}
+
+
+def _edge_type(value: str) -> EdgeType:
+    """Resolve an edge type value; unknown values raise EdgeType's usual ValueError"""
+    return _EDGE_TYPES_BY_VALUE.get(value) or EdgeType(value)
+
+
+def bounded_simple_paths(graph: nx.DiGraph, source: str, target: str, cutoff: Optional[int] = None):
+    """
+    Generate simple paths from source to target with at most cutoff edges
+    
+    Produces the same paths, in the same order, as nx.all_simple_paths. A bounded
+    breadth-first search backwards from target runs first, and the depth-first walk
+    from source never enters a node that cannot reach target in the hops it has
+    left. Branches are cut where the two searches cannot meet, instead of being
+    walked out to the cutoff.
+    
+    Args:
+        graph: Directed graph
+        source: Source node ID
+        target: Target node ID
+        cutoff: Maximum path length in edges (None = no limit)
+        
+    Returns:
+        Iterator of paths as node ID lists
+    """
+    if cutoff is None:
+        cutoff = len(graph) - 1
+    # Short searches gain nothing from the backward pass; NetworkX also handles
+    # missing nodes and other edge cases
+    if cutoff <= 2 or source == target or not graph.is_directed() or \
+            source not in graph or target not in graph:
+        return nx.all_simple_paths(graph, source, target, cutoff=cutoff)
+    return _pruned_simple_paths(graph, source, target, cutoff)
+
+
+def _pruned_simple_paths(graph: nx.DiGraph, source: str, target: str, cutoff: int):
+    """Depth-first simple path search for bounded_simple_paths"""
+    # Fewest hops from each node to target, up to the cutoff
+    distance = {target: 0}
+    frontier = [target]
+    hops = 0
+    predecessors = graph.pred
+    while frontier and hops < cutoff:
+        hops += 1
+        next_frontier = []
+        for node_id in frontier:
+            for predecessor in predecessors[node_id]:
+                if predecessor not in distance:
+                    distance[predecessor] = hops
+                    next_frontier.append(predecessor)
+        frontier = next_frontier
+    
+    if source not in distance:
+        return
+    
+    successors = graph.succ
+    path = [source]
+    visited = {source}
+    stack = [iter(successors[source])]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+            visited.discard(path.pop())
+            continue
+        if child in visited:
+            continue
+        if child == target:
+            yield path + [child]
+            continue
+        
+        # Edges left once the walk has stepped to child
+        remaining = cutoff - len(path)
+        if distance.get(child, remaining + 1) > remaining:
+            continue
+        
+        path.append(child)
+        visited.add(child)
+        stack.append(iter(successors[child]))
+
 
 class GraphQuery:
     """
@@ -44,34 +127,33 @@ class GraphQuery:
         """
         try:
             path_nodes = nx.shortest_path(self.graph, source_id, target_id)
-            
-            if len(path_nodes) < 2:
-                return None
-            
-            # Build edges
-            path_edges = []
-            for i in range(len(path_nodes) - 1):
-                edge_data = self.graph.get_edge_data(path_nodes[i], path_nodes[i + 1])
-                edge = Edge(
-                    source_id=path_nodes[i],
-                    target_id=path_nodes[i + 1],
-                    type=EdgeType(edge_data.get('type', 'has_role')),
-                    properties=edge_data
-                )
-                path_edges.append(edge)
-            
-            # Create attack path
-            return AttackPath(
-                source_node=self.nodes[source_id],
-                target_node=self.nodes[target_id],
-                path_nodes=[self.nodes[n] for n in path_nodes],
-                path_edges=path_edges,
-                risk_score=self._calculate_path_risk(path_edges),
-                description=f"Path from {source_id} to {target_id}"
-            )
-            
         except nx.NetworkXNoPath:
             return None
+        
+        if len(path_nodes) < 2:
+            return None
+        
+        # Build edges
+        path_edges = []
+        for i in range(len(path_nodes) - 1):
+            edge_data = self.graph.get_edge_data(path_nodes[i], path_nodes[i + 1])
+            edge = Edge(
+                source_id=path_nodes[i],
+                target_id=path_nodes[i + 1],
+                type=_edge_type(edge_data.get('type', 'has_role')),
+                properties=edge_data
+            )
+            path_edges.append(edge)
+        
+        # Create attack path
+        return AttackPath(
+            source_node=self.nodes[source_id],
+            target_node=self.nodes[target_id],
+            path_nodes=[self.nodes[n] for n in path_nodes],
+            path_edges=path_edges,
+            risk_score=self._calculate_path_risk(path_edges),
+            description=f"Path from {source_id} to {target_id}"
+        )
     
     def find_all_paths(
         self,
@@ -90,22 +172,30 @@ class GraphQuery:
         Returns:
             List of attack paths
         """
+        return self._find_all_paths(source_id, target_id, max_length, {})
+    
+    def _find_all_paths(
+        self,
+        source_id: str,
+        target_id: str,
+        max_length: Optional[int],
+        edge_cache: Dict[Tuple[str, str], Optional[Tuple[Edge, float]]]
+    ) -> List[AttackPath]:
+        """find_all_paths with an edge cache owned by the calling query"""
         if max_length is None:
             max_length = self.config.analysis_max_path_length
         
         paths = []
-        try:
-            for path_nodes in nx.all_simple_paths(
-                self.graph,
-                source_id,
-                target_id,
-                cutoff=max_length
-            ):
-                attack_path = self._build_attack_path(path_nodes)
-                if attack_path:
-                    paths.append(attack_path)
-        except nx.NetworkXNoPath:
-            pass
+        # bounded_simple_paths stops early when target is out of reach within max_length
+        for path_nodes in bounded_simple_paths(
+            self.graph,
+            source_id,
+            target_id,
+            cutoff=max_length
+        ):
+            attack_path = self._build_attack_path(path_nodes, edge_cache)
+            if attack_path:
+                paths.append(attack_path)
         
         # Sort by risk score
         paths.sort(key=lambda p: p.risk_score, reverse=True)
@@ -153,12 +243,13 @@ class GraphQuery:
             List of attack paths
         """
         paths = []
+        edge_cache = {}
         
         # Find all nodes that have access to the resource
         accessor_nodes = []
         for predecessor in self.graph.predecessors(resource_id):
             edge_data = self.graph.get_edge_data(predecessor, resource_id)
-            edge_type = EdgeType(edge_data.get('type', ''))
+            edge_type = _edge_type(edge_data.get('type', ''))
             
             # Check if access level matches
             if access_level:
@@ -175,16 +266,16 @@ class GraphQuery:
         for accessor in accessor_nodes:
             if accessor == source_id:
                 # Direct access
-                path = self._build_attack_path([source_id, resource_id])
+                path = self._build_attack_path([source_id, resource_id], edge_cache)
                 if path:
                     paths.append(path)
             else:
                 # Indirect access through accessor
-                accessor_paths = self.find_all_paths(source_id, accessor)
+                accessor_paths = self._find_all_paths(source_id, accessor, None, edge_cache)
                 for accessor_path in accessor_paths:
                     # Extend path to include resource
                     extended_nodes = accessor_path.path_nodes + [self.nodes[resource_id]]
-                    extended_path = self._build_attack_path([n.id for n in extended_nodes])
+                    extended_path = self._build_attack_path([n.id for n in extended_nodes], edge_cache)
                     if extended_path:
                         paths.append(extended_path)
         
@@ -232,32 +323,32 @@ class GraphQuery:
             List of attack paths
         """
         paths = []
+        edge_cache = {}
         
         # Find all service accounts that can be impersonated
+        reachable = self._reachable_from(source_id)
         for node_id, node in self.nodes.items():
             if node.type != NodeType.SERVICE_ACCOUNT:
                 continue
+            if reachable is not None and node_id in self.graph and node_id not in reachable:
+                continue
             
             # Check if there's an impersonation path
-            try:
-                path_nodes = nx.shortest_path(self.graph, source_id, node_id)
-                
-                # Verify path contains impersonation edge
-                has_impersonation = False
-                for i in range(len(path_nodes) - 1):
-                    edge_data = self.graph.get_edge_data(path_nodes[i], path_nodes[i + 1])
-                    if edge_data and EdgeType(edge_data.get('type', '')) == EdgeType.CAN_IMPERSONATE:
-                        has_impersonation = True
-                        break
-                
-                if has_impersonation:
-                    attack_path = self._build_attack_path(path_nodes)
-                    if attack_path:
-                        attack_path.description = f"Can impersonate service account: {node.name}"
-                        paths.append(attack_path)
-                        
-            except nx.NetworkXNoPath:
-                continue
+            path_nodes = nx.shortest_path(self.graph, source_id, node_id)
+            
+            # Verify path contains impersonation edge
+            has_impersonation = False
+            for i in range(len(path_nodes) - 1):
+                edge_data = self.graph.get_edge_data(path_nodes[i], path_nodes[i + 1])
+                if edge_data and _edge_type(edge_data.get('type', '')) == EdgeType.CAN_IMPERSONATE:
+                    has_impersonation = True
+                    break
+            
+            if has_impersonation:
+                attack_path = self._build_attack_path(path_nodes, edge_cache)
+                if attack_path:
+                    attack_path.description = f"Can impersonate service account: {node.name}"
+                    paths.append(attack_path)
         
         return paths
     
@@ -277,6 +368,7 @@ class GraphQuery:
             List of attack paths
         """
         paths = []
+        edge_cache = {}
         source_node = self.nodes.get(source_id)
         if not source_node:
             return paths
@@ -287,9 +379,12 @@ class GraphQuery:
             source_project = source_node.name.split('/')[-1]
         
         # Find paths to other projects
+        reachable = self._reachable_from(source_id)
         for node_id, node in self.nodes.items():
             if node.type != NodeType.PROJECT:
                 continue
+            if reachable is not None and node_id in self.graph and node_id not in reachable:
+                continue
             
             project_id = node.name.split('/')[-1]
             
@@ -302,7 +397,7 @@ class GraphQuery:
                 continue
             
             # Find paths to project resources
-            project_paths = self.find_all_paths(source_id, node_id)
+            project_paths = self._find_all_paths(source_id, node_id, None, edge_cache)
             for path in project_paths:
                 path.description = f"Lateral movement to project: {project_id}"
             paths.extend(project_paths)
@@ -328,7 +423,7 @@ class GraphQuery:
                 continue
             
             edge_data = self.graph.get_edge_data(node_id, successor)
-            if edge_data and EdgeType(edge_data.get('type', '')) == EdgeType.HAS_ROLE:
+            if edge_data and _edge_type(edge_data.get('type', '')) == EdgeType.HAS_ROLE:
                 resource = edge_data.get('resource', 'unknown')
                 role_permissions = successor_node.properties.get('permissions', [])
                 
@@ -822,12 +917,37 @@ class GraphQuery:
         import fnmatch
         return any(fnmatch.fnmatch(perm, pattern) for perm in permissions)
     
-    def _build_attack_path(self, node_ids: List[str]) -> Optional[AttackPath]:
+    def _reachable_from(self, source_id: str) -> Optional[Set[str]]:
+        """
+        Find every node reachable from source_id, including itself
+        
+        Queries that check many targets from one source search the graph once with
+        this instead of once per target.
+        
+        Args:
+            source_id: Source node ID
+            
+        Returns:
+            Set of reachable node IDs, or None if source_id is not in the graph
+        """
+        if source_id not in self.graph:
+            return None
+        reachable = nx.descendants(self.graph, source_id)
+        reachable.add(source_id)
+        return reachable
+    
+    def _build_attack_path(
+        self,
+        node_ids: List[str],
+        edge_cache: Optional[Dict[Tuple[str, str], Optional[Tuple[Edge, float]]]] = None
+    ) -> Optional[AttackPath]:
         """
         Build an AttackPath from a list of node IDs
         
         Args:
             node_ids: List of node IDs in path order
+            edge_cache: Edges already built during the current query. It must
+                not outlive that query, since the graph may change afterwards.
             
         Returns:
             AttackPath or None
@@ -847,22 +967,19 @@ class GraphQuery:
             path_nodes.append(node)
         
         # Build edges list
-        for i in range(len(node_ids) - 1):
-            source_id = node_ids[i]
-            target_id = node_ids[i + 1]
-            
-            edge_data = self.graph.get_edge_data(source_id, target_id)
-            if not edge_data:
+        if edge_cache is None:
+            edge_cache = {}
+        for edge_key in zip(node_ids, node_ids[1:]):
+            if edge_key in edge_cache:
+                cached = edge_cache[edge_key]
+            else:
+                cached = edge_cache[edge_key] = self._build_edge(*edge_key)
+            if cached is None:
                 return None
             
-            edge = Edge(
-                source_id=source_id,
-                target_id=target_id,
-                type=EdgeType(edge_data.get('type', EdgeType.HAS_ACCESS_TO.value)),
-                properties={k: v for k, v in edge_data.items() if k != 'type'}
-            )
+            edge, risk = cached
             path_edges.append(edge)
-            total_risk += edge.get_risk_score()
+            total_risk += risk
         
         # Calculate average risk
         avg_risk = total_risk / len(path_edges) if path_edges else 0.0
@@ -875,6 +992,20 @@ class GraphQuery:
             risk_score=avg_risk
         )
     
+    def _build_edge(self, source_id: str, target_id: str) -> Optional[Tuple[Edge, float]]:
+        """Build the Edge between two nodes with its risk score, or None if they are not connected"""
+        edge_data = self.graph.get_edge_data(source_id, target_id)
+        if not edge_data:
+            return None
+        
+        edge = Edge(
+            source_id=source_id,
+            target_id=target_id,
+            type=_edge_type(edge_data.get('type', EdgeType.HAS_ACCESS_TO.value)),
+            properties={k: v for k, v in edge_data.items() if k != 'type'}
+        )
+        return edge, edge.get_risk_score()
+    
     def _get_node_id_from_identity(self, identity: str) -> Optional[str]:
         """Convert identity string to node ID"""
         if identity.startswith('user:'):
@@ -57,10 +57,20 @@ class Config:
         'roles/iam.securityAdmin',
         'roles/resourcemanager.organizationAdmin'
     ])
+    analysis_internal_domains: List[str] = field(default_factory=lambda: [
+        'example.com',
+        'yourdomain.com'
+    ])
     analysis_risk_thresholds_critical: float = 0.8
     analysis_risk_thresholds_high: float = 0.6
     analysis_risk_thresholds_medium: float = 0.4
     analysis_risk_thresholds_low: float = 0.2
+    analysis_max_paths_per_bucket: int = 0  # 0 = no limit
+    analysis_max_paths_per_pair: int = 0  # 0 = no limit
+    analysis_max_total_paths: int = 0  # 0 = no limit
+    analysis_time_budget_s: float = 0  # 0 = no limit
+    analysis_workers: int = 1  # Processes for the multi-hop search (1 = in-process, 0 = one per CPU)
+    analysis_centrality_sample_k: int = 500  # 0 = always exact betweenness centrality
     
     # Performance settings
     performance_max_concurrent_requests: int = 10
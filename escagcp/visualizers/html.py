@@ -2,6 +2,8 @@
 HTML visualization for EscaGCP graphs - Dashboard style
 """
 
+import base64
+import gzip
 import json
 import networkx as nx
 from pyvis.network import Network
@@ -1199,8 +1201,9 @@ class HTMLVisualizer:
     </div>
     
     <script>
-        // Embed the graph data for sharing
-        const graphData = {json.dumps(self._serialize_graph_for_standalone(risk_scores, highlight_nodes))};
+        // Embed the graph data for sharing (gzip + base64, decoded on demand by loadGraphData)
+        const graphDataGzip = "{self._compress_json_payload(self._serialize_graph_for_standalone(risk_scores, highlight_nodes))}";
+        let graphData = null;
         const riskScores = {json.dumps(risk_scores) if risk_scores else '{}'};
         const attackPaths = {json.dumps(attack_paths) if attack_paths else '[]'};
         const dangerousRolesInfo = {json.dumps(dangerous_roles_info)};
@@ -1620,6 +1623,19 @@ class HTMLVisualizer:
         
         return dangerous_assignments
     
+    def _dangerous_role_holders(self) -> List[str]:
+        """Identity node IDs, in graph order, holding any dangerous role"""
+        # Walk from the few dangerous role nodes back to their holders instead of
+        # checking every identity's neighbors
+        holders = set()
+        for node_id, node_data in self.graph.nodes(data=True):
+            if node_id.startswith('role:') and node_data.get('name', node_id) in self.DANGEROUS_ROLES:
+                holders.update(
+                    holder for holder in self.graph.predecessors(node_id)
+                    if holder.startswith(('user:', 'sa:', 'group:'))
+                )
+        return [node_id for node_id in self.graph if node_id in holders]
+    
     def _calculate_statistics(self, risk_scores: Dict[str, Any], attack_paths: List[Dict[str, Any]]) -> Dict[str, int]:
         """Calculate dashboard statistics"""
         high_risk_count = 0
@@ -1630,17 +1646,9 @@ class HTMLVisualizer:
                     high_risk_count += 1
         
         # Also count nodes that have dangerous roles as high risk
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_id.startswith(('user:', 'sa:', 'group:')):
-                # Check if this identity has any dangerous roles
-                for neighbor in self.graph.neighbors(node_id):
-                    if neighbor.startswith('role:'):
-                        role_name = self.graph.nodes[neighbor].get('name', neighbor)
-                        if role_name in self.DANGEROUS_ROLES:
-                            # This is a high risk node
-                            if node_id not in risk_scores or (risk_scores.get(node_id, {}).get('total', 0) if isinstance(risk_scores.get(node_id, {}), dict) else risk_scores.get(node_id, 0)) <= 0.6:
-                                high_risk_count += 1
-                                break
+        for node_id in self._dangerous_role_holders():
+            if node_id not in risk_scores or (risk_scores.get(node_id, {}).get('total', 0) if isinstance(risk_scores.get(node_id, {}), dict) else risk_scores.get(node_id, 0)) <= 0.6:
+                high_risk_count += 1
         
         dangerous_roles_count = 0
         for node_id, node_data in self.graph.nodes(data=True):
@@ -1826,26 +1834,17 @@ class HTMLVisualizer:
                     })
         
         # Also check for nodes with dangerous roles
-        for node_id, node_data in self.graph.nodes(data=True):
-            if node_id.startswith(('user:', 'sa:', 'group:')):
-                # Check if this identity has any dangerous roles
-                has_dangerous_role = False
-                for neighbor in self.graph.neighbors(node_id):
-                    if neighbor.startswith('role:'):
-                        role_name = self.graph.nodes[neighbor].get('name', neighbor)
-                        if role_name in self.DANGEROUS_ROLES:
-                            has_dangerous_role = True
-                            break
-                
-                if has_dangerous_role:
-                    # Check if not already in high_risk_nodes
-                    if not any(n['id'] == node_id for n in high_risk_nodes):
-                        high_risk_nodes.append({
-                            'id': node_id,
-                            'name': node_data.get('name', node_id),
-                            'type': node_data.get('type', 'unknown'),
-                            'risk': 0.7  # Default risk for dangerous role holders
-                        })
+        listed = {node['id'] for node in high_risk_nodes}
+        for node_id in self._dangerous_role_holders():
+            # Check if not already in high_risk_nodes
+            if node_id not in listed:
+                node_data = self.graph.nodes[node_id]
+                high_risk_nodes.append({
+                    'id': node_id,
+                    'name': node_data.get('name', node_id),
+                    'type': node_data.get('type', 'unknown'),
+                    'risk': 0.7  # Default risk for dangerous role holders
+                })
         
         # Sort by risk score
         high_risk_nodes.sort(key=lambda x: x['risk'], reverse=True)
@@ -2409,7 +2408,7 @@ class HTMLVisualizer:
                 <h3 class="info-card-title">Critical Attack Paths</h3>
                 ${attackPaths.filter(p => p.risk_score > 0.8).slice(0, 5).map(path => 
                     `<div class="risk-item risk-high">
-                        <strong>${path.path}</strong><br>
+                        <strong>${path.path || path.path_nodes.map(n => n.id || n).join(' → ')}</strong><br>
                         Risk Score: ${path.risk_score.toFixed(2)}
                     </div>`
                 ).join('')}
@@ -4241,6 +4240,11 @@ class HTMLVisualizer:
         else:
             return "low"
     
+    def _compress_json_payload(self, data: Any) -> str:
+        """Serialize data to compact JSON, gzip it and base64-encode it for embedding"""
+        raw = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        return base64.b64encode(gzip.compress(raw, compresslevel=6)).decode('ascii')
+    
     def _get_logo_base64(self) -> str:
         """Get the EscaGCP logo as base64"""
         try:
@@ -4656,10 +4660,22 @@ class HTMLVisualizer:
             }
         }
         
-        function generateStandaloneReport() {
+        async function loadGraphData() {
+            // Decompress the embedded graph payload the first time it is needed
+            if (graphData === null) {
+                const bytes = Uint8Array.from(atob(graphDataGzip), c => c.charCodeAt(0));
+                const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                graphData = JSON.parse(await new Response(stream).text());
+            }
+            return graphData;
+        }
+        
+        async function generateStandaloneReport() {
             document.getElementById('shareLoading').style.display = 'block';
             
             try {
+                await loadGraphData();
+                
                 // Create the standalone HTML content using the embedded data
                 const standaloneHTML = createStandaloneHTML();
                 
@@ -4874,7 +4890,7 @@ class HTMLVisualizer:
                 <h3 class="info-card-title">Critical Attack Paths</h3>
                 ${attackPaths.filter(p => p.risk_score > 0.8).slice(0, 5).map(path => 
                     `<div class="risk-item risk-high">
-                        <strong>${path.path}</strong><br>
+                        <strong>${path.path || path.path_nodes.map(n => n.id || n).join(' → ')}</strong><br>
                         Risk Score: ${path.risk_score.toFixed(2)}
                     </div>`
                 ).join('')}
@@ -5137,7 +5153,8 @@ class HTMLVisualizer:
             if (nodeMetadata.length === 0 && pathData.path_nodes) {
                 nodeMetadata = pathData.path_nodes.map((node, idx) => ({
                     id: node.id || node,
-                    label: node.name || node.id || node,
+                    // Bare node IDs are labelled without their type prefix (user:, sa:, ...)
+                    label: typeof node === 'string' ? node.slice(node.indexOf(':') + 1) : (node.name || node.id),
                     type: node.type || 'unknown',
                     color: '#6b46c1',
                     risk_level: idx === 0 ? 'source' : idx === pathData.path_nodes.length - 1 ? 'target' : 'intermediate'
@@ -9,76 +9,119 @@ This script demonstrates the new enhanced modal functionality with:
 - Export capabilities
 """
 
+import argparse
+import itertools
 import json
 import random
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional
 import networkx as nx
+import numpy as np
+import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from escagcp.visualizers.html import HTMLVisualizer
 from escagcp.utils import Config
 
 
-def create_comprehensive_graph():
-    """Create a comprehensive test graph with many nodes and edges"""
+# Edge type labels shared by the add_edge calls and lookup tables
+MEMBER_OF = "MEMBER_OF"
+HAS_ROLE = "HAS_ROLE"
+APPLIES_TO = "APPLIES_TO"
+CONTAINS = "CONTAINS"
+CAN_IMPERSONATE_SA = "CAN_IMPERSONATE_SA"
+CAN_CREATE_SERVICE_ACCOUNT_KEY = "CAN_CREATE_SERVICE_ACCOUNT_KEY"
+CAN_ACT_AS_VIA_VM = "CAN_ACT_AS_VIA_VM"
+CAN_DEPLOY_FUNCTION_AS = "CAN_DEPLOY_FUNCTION_AS"
+CAN_DEPLOY_CLOUD_RUN_AS = "CAN_DEPLOY_CLOUD_RUN_AS"
+CAN_LOGIN_TO_VM = "CAN_LOGIN_TO_VM"
+CAN_TRIGGER_BUILD_AS = "CAN_TRIGGER_BUILD_AS"
+
+# Role node IDs referenced by edges and risk scoring
+OWNER_ROLE = "role:roles/owner"
+EDITOR_ROLE = "role:roles/editor"
+SECURITY_ADMIN_ROLE = "role:roles/iam.securityAdmin"
+TOKEN_CREATOR_ROLE = "role:roles/iam.serviceAccountTokenCreator"
+
+
+class DemoAttackPath(NamedTuple):
+    """Typed demo attack path record; converted to a dict only when handed to the visualizer"""
+    risk_score: float
+    description: str
+    category: str
+    length: int
+    path_nodes: List[str]
+    path_edges: Optional[List[Dict[str, Any]]] = None
+
+
+# Edge types used when wiring synthetic principals to service accounts
+SYNTHETIC_SA_EDGE_TYPES = np.array([
+    CAN_IMPERSONATE_SA,
+    CAN_CREATE_SERVICE_ACCOUNT_KEY,
+    CAN_ACT_AS_VIA_VM,
+    CAN_DEPLOY_FUNCTION_AS,
+    CAN_DEPLOY_CLOUD_RUN_AS,
+    CAN_TRIGGER_BUILD_AS,
+], dtype=object)
+
+
+def create_comprehensive_graph(synthetic_users=0, synthetic_edges=0, seed=0):
+    """
+    Create a comprehensive test graph with many nodes and edges
+    
+    Args:
+        synthetic_users: Number of generated users to add on top of the curated graph
+        synthetic_edges: Number of random edges from generated users to roles and service accounts
+        seed: Seed for the synthetic edge generator
+    """
     graph = nx.DiGraph()
     
     # Create multiple projects
     projects = [f"project-{i}" for i in range(1, 6)]
     for project in projects:
-        graph.add_node(f"project:{project}", 
+        graph.add_node(sys.intern(f"project:{project}"), 
                       type="project", 
                       name=project,
                       project_id=project,
                       description=f"Test project {project}")
     
     # Create users
-    users = [
-        ("alice", "alice@example.com", "Alice Smith"),
-        ("bob", "bob@example.com", "Bob Johnson"),
-        ("charlie", "charlie@example.com", "Charlie Brown"),
-        ("david", "david@example.com", "David Wilson"),
-        ("eve", "eve@example.com", "Eve Davis"),
-        ("frank", "frank@external.com", "Frank External"),
-    ]
-    
-    for username, email, full_name in users:
-        graph.add_node(f"user:{email}",
-                      type="user",
-                      name=email,
-                      email=email,
-                      full_name=full_name)
-    
-    # Create service accounts
-    service_accounts = []
-    for project in projects[:3]:  # First 3 projects have SAs
-        for sa_type in ["compute", "app", "function", "storage"]:
-            sa_email = f"{sa_type}@{project}.iam.gserviceaccount.com"
-            sa_id = f"sa:{sa_type}@{project}.iam"
-            service_accounts.append(sa_id)
-            graph.add_node(sa_id,
-                          type="service_account",
-                          name=f"{sa_type}@{project}.iam",
-                          email=sa_email,
-                          project_id=project,
-                          description=f"{sa_type.title()} service account")
+    users = pd.DataFrame([
+        ("alice@example.com", "Alice Smith"),
+        ("bob@example.com", "Bob Johnson"),
+        ("charlie@example.com", "Charlie Brown"),
+        ("david@example.com", "David Wilson"),
+        ("eve@example.com", "Eve Davis"),
+        ("frank@external.com", "Frank External"),
+    ], columns=["email", "full_name"])
+    users.insert(0, "type", "user")
+    users.insert(1, "name", users["email"])
+    add_node_table(graph, "user:" + users["email"], users)
+    
+    # Create service accounts (first 3 projects have SAs)
+    service_accounts = pd.DataFrame(
+        itertools.product(projects[:3], ["compute", "app", "function", "storage"]),
+        columns=["project_id", "sa_type"]
+    )
+    service_accounts.insert(0, "type", "service_account")
+    service_accounts.insert(1, "name", service_accounts["sa_type"] + "@" + service_accounts["project_id"] + ".iam")
+    service_accounts.insert(2, "email", service_accounts["name"] + ".gserviceaccount.com")
+    service_accounts["description"] = service_accounts["sa_type"].str.title() + " service account"
+    add_node_table(graph, "sa:" + service_accounts["name"], service_accounts.drop(columns="sa_type"))
     
     # Create groups
-    groups = [
+    groups = pd.DataFrame([
         ("developers@example.com", "Developers Group"),
         ("admins@example.com", "Administrators Group"),
         ("security@example.com", "Security Team"),
         ("external-contractors@external.com", "External Contractors"),
-    ]
-    
-    for email, description in groups:
-        graph.add_node(f"group:{email}",
-                      type="group",
-                      name=email,
-                      email=email,
-                      description=description)
+    ], columns=["email", "description"])
+    groups.insert(0, "type", "group")
+    groups.insert(1, "name", groups["email"])
+    add_node_table(graph, "group:" + groups["email"], groups)
     
     # Create roles
-    roles = [
+    roles = pd.DataFrame([
         ("roles/owner", "Full control over all resources"),
         ("roles/editor", "Can modify all resources"),
         ("roles/viewer", "Read-only access"),
@@ -91,13 +134,9 @@ def create_comprehensive_graph():
         ("roles/container.admin", "Can manage GKE clusters"),
         ("roles/iam.securityAdmin", "Can modify IAM policies"),
         ("custom-developer-role", "Custom role for developers"),
-    ]
-    
-    for role_name, description in roles:
-        graph.add_node(f"role:{role_name}",
-                      type="role",
-                      name=role_name,
-                      description=description)
+    ], columns=["name", "description"])
+    roles.insert(0, "type", "role")
+    add_node_table(graph, "role:" + roles["name"], roles)
     
     # Create folders and organization
     graph.add_node("org:example-org",
@@ -107,123 +146,180 @@ def create_comprehensive_graph():
     
     folders = ["production", "development", "testing"]
     for folder in folders:
-        graph.add_node(f"folder:{folder}",
+        graph.add_node(sys.intern(f"folder:{folder}"),
                       type="folder",
                       name=folder,
                       description=f"{folder.title()} environment")
     
     # Add edges - Group memberships
-    graph.add_edge("user:alice@example.com", "group:admins@example.com", type="MEMBER_OF")
-    graph.add_edge("user:bob@example.com", "group:developers@example.com", type="MEMBER_OF")
-    graph.add_edge("user:charlie@example.com", "group:developers@example.com", type="MEMBER_OF")
-    graph.add_edge("user:david@example.com", "group:security@example.com", type="MEMBER_OF")
-    graph.add_edge("user:eve@example.com", "group:admins@example.com", type="MEMBER_OF")
-    graph.add_edge("user:frank@external.com", "group:external-contractors@external.com", type="MEMBER_OF")
+    graph.add_edge("user:alice@example.com", "group:admins@example.com", type=MEMBER_OF)
+    graph.add_edge("user:bob@example.com", "group:developers@example.com", type=MEMBER_OF)
+    graph.add_edge("user:charlie@example.com", "group:developers@example.com", type=MEMBER_OF)
+    graph.add_edge("user:david@example.com", "group:security@example.com", type=MEMBER_OF)
+    graph.add_edge("user:eve@example.com", "group:admins@example.com", type=MEMBER_OF)
+    graph.add_edge("user:frank@external.com", "group:external-contractors@external.com", type=MEMBER_OF)
     
     # Add edges - Role assignments
     # Admins have owner roles
-    graph.add_edge("group:admins@example.com", "role:roles/owner", type="HAS_ROLE")
-    graph.add_edge("user:alice@example.com", "role:roles/iam.securityAdmin", type="HAS_ROLE")
+    graph.add_edge("group:admins@example.com", OWNER_ROLE, type=HAS_ROLE)
+    graph.add_edge("user:alice@example.com", SECURITY_ADMIN_ROLE, type=HAS_ROLE)
     
     # Developers have various roles
-    graph.add_edge("group:developers@example.com", "role:roles/editor", type="HAS_ROLE")
-    graph.add_edge("user:bob@example.com", "role:roles/iam.serviceAccountTokenCreator", type="HAS_ROLE")
-    graph.add_edge("user:charlie@example.com", "role:roles/compute.admin", type="HAS_ROLE")
+    graph.add_edge("group:developers@example.com", EDITOR_ROLE, type=HAS_ROLE)
+    graph.add_edge("user:bob@example.com", TOKEN_CREATOR_ROLE, type=HAS_ROLE)
+    graph.add_edge("user:charlie@example.com", "role:roles/compute.admin", type=HAS_ROLE)
     
     # Security team
-    graph.add_edge("group:security@example.com", "role:roles/viewer", type="HAS_ROLE")
-    graph.add_edge("user:david@example.com", "role:roles/iam.securityAdmin", type="HAS_ROLE")
+    graph.add_edge("group:security@example.com", "role:roles/viewer", type=HAS_ROLE)
+    graph.add_edge("user:david@example.com", SECURITY_ADMIN_ROLE, type=HAS_ROLE)
     
     # External contractors - limited access
-    graph.add_edge("group:external-contractors@external.com", "role:custom-developer-role", type="HAS_ROLE")
+    graph.add_edge("group:external-contractors@external.com", "role:custom-developer-role", type=HAS_ROLE)
     
     # Add dangerous edges - Service account impersonation
     graph.add_edge("user:bob@example.com", "sa:compute@project-1.iam", 
-                  type="CAN_IMPERSONATE_SA",
+                  type=CAN_IMPERSONATE_SA,
                   permission="iam.serviceAccounts.getAccessToken",
                   resource_scope="project/project-1")
     
     graph.add_edge("user:alice@example.com", "sa:app@project-1.iam",
-                  type="CAN_CREATE_SERVICE_ACCOUNT_KEY",
+                  type=CAN_CREATE_SERVICE_ACCOUNT_KEY,
                   permission="iam.serviceAccountKeys.create",
                   resource_scope="project/project-1")
     
     # VM-based attacks
     graph.add_edge("user:charlie@example.com", "sa:compute@project-2.iam",
-                  type="CAN_ACT_AS_VIA_VM",
+                  type=CAN_ACT_AS_VIA_VM,
                   permission="compute.instances.setServiceAccount + iam.serviceAccounts.actAs",
                   resource_scope="project/project-2")
     
     # Cloud Function deployment
     graph.add_edge("user:bob@example.com", "sa:function@project-1.iam",
-                  type="CAN_DEPLOY_FUNCTION_AS",
+                  type=CAN_DEPLOY_FUNCTION_AS,
                   permission="cloudfunctions.functions.create + iam.serviceAccounts.actAs",
                   resource_scope="project/project-1")
     
     # Cloud Run deployment
     graph.add_edge("group:developers@example.com", "sa:app@project-2.iam",
-                  type="CAN_DEPLOY_CLOUD_RUN_AS",
+                  type=CAN_DEPLOY_CLOUD_RUN_AS,
                   permission="run.services.create + iam.serviceAccounts.actAs",
                   resource_scope="project/project-2")
     
     # VM login access
     graph.add_edge("user:frank@external.com", "project:project-3",
-                  type="CAN_LOGIN_TO_VM",
+                  type=CAN_LOGIN_TO_VM,
                   permission="compute.instances.osLogin",
                   resource_scope="project/project-3")
     
     # Cloud Build triggers
     graph.add_edge("user:charlie@example.com", "sa:compute@project-3.iam",
-                  type="CAN_TRIGGER_BUILD_AS",
+                  type=CAN_TRIGGER_BUILD_AS,
                   permission="cloudbuild.builds.create",
                   resource_scope="project/project-3")
     
     # Add some role-to-resource relationships
     for project in projects[:3]:
-        graph.add_edge("role:roles/owner", f"project:{project}", type="APPLIES_TO")
-        graph.add_edge("role:roles/editor", f"project:{project}", type="APPLIES_TO")
+        graph.add_edge(OWNER_ROLE, f"project:{project}", type=APPLIES_TO)
+        graph.add_edge(EDITOR_ROLE, f"project:{project}", type=APPLIES_TO)
     
     # Add folder relationships
-    graph.add_edge("folder:production", "project:project-1", type="CONTAINS")
-    graph.add_edge("folder:production", "project:project-2", type="CONTAINS")
-    graph.add_edge("folder:development", "project:project-3", type="CONTAINS")
-    graph.add_edge("folder:testing", "project:project-4", type="CONTAINS")
-    graph.add_edge("folder:testing", "project:project-5", type="CONTAINS")
+    graph.add_edge("folder:production", "project:project-1", type=CONTAINS)
+    graph.add_edge("folder:production", "project:project-2", type=CONTAINS)
+    graph.add_edge("folder:development", "project:project-3", type=CONTAINS)
+    graph.add_edge("folder:testing", "project:project-4", type=CONTAINS)
+    graph.add_edge("folder:testing", "project:project-5", type=CONTAINS)
     
     # Add org relationships
     for folder in folders:
-        graph.add_edge("org:example-org", f"folder:{folder}", type="CONTAINS")
+        graph.add_edge("org:example-org", f"folder:{folder}", type=CONTAINS)
+    
+    if synthetic_users:
+        add_synthetic_principals(graph, synthetic_users, synthetic_edges, seed)
     
     return graph
 
 
+def add_node_table(graph, node_ids, table):
+    """Add one node per table row, using the row's columns as node attributes"""
+    graph.add_nodes_from(zip(map(sys.intern, node_ids), table.to_dict("records")))
+
+
+def add_synthetic_principals(graph, n_users, n_edges, seed=0):
+    """
+    Add generated users and random role/service-account edges for load testing
+    
+    Edge endpoints and types are drawn in bulk with NumPy, so only the final
+    add_nodes_from/add_edges_from calls run per element in Python.
+    """
+    rng = np.random.default_rng(seed)
+    
+    emails = [f"synthetic-{i}@example.com" for i in range(n_users)]
+    user_ids = np.array([sys.intern(f"user:{email}") for email in emails], dtype=object)
+    graph.add_nodes_from(
+        (user_id, {"type": "user", "name": email, "email": email})
+        for user_id, email in zip(user_ids, emails)
+    )
+    
+    targets = np.array(
+        [n for n, node_type in graph.nodes(data="type") if node_type in ("role", "service_account")],
+        dtype=object
+    )
+    if not n_edges or not len(targets):
+        return
+    target_is_role = np.array([graph.nodes[t]["type"] == "role" for t in targets])
+    
+    src_idx = rng.integers(0, n_users, size=n_edges)
+    dst_idx = rng.integers(0, len(targets), size=n_edges)
+    type_idx = rng.integers(0, len(SYNTHETIC_SA_EDGE_TYPES), size=n_edges)
+    edge_types = np.where(target_is_role[dst_idx], HAS_ROLE, SYNTHETIC_SA_EDGE_TYPES[type_idx])
+    
+    graph.add_edges_from(
+        (src, dst, {"type": edge_type})
+        for src, dst, edge_type in zip(user_ids[src_idx], targets[dst_idx], edge_types)
+    )
+
+
+# Risk contributed by an outgoing edge of a dangerous type
+EDGE_TYPE_RISK = {
+    CAN_IMPERSONATE_SA: 0.8,
+    CAN_CREATE_SERVICE_ACCOUNT_KEY: 0.8,
+    CAN_ACT_AS_VIA_VM: 0.8,
+    CAN_DEPLOY_FUNCTION_AS: 0.8,
+    CAN_DEPLOY_CLOUD_RUN_AS: 0.8,
+}
+
+# Risk contributed by holding a dangerous role
+ROLE_TARGET_RISK = {
+    OWNER_ROLE: 0.9,
+    SECURITY_ADMIN_ROLE: 0.9,
+    EDITOR_ROLE: 0.7,
+    TOKEN_CREATOR_ROLE: 0.7,
+}
+
+# Highest score either table can assign; once a node reaches it no other edge can raise it
+MAX_NODE_RISK = max(*EDGE_TYPE_RISK.values(), *ROLE_TARGET_RISK.values())
+
+
 def generate_risk_scores(graph):
     """Generate risk scores for nodes"""
     risk_scores = {}
     
-    # High risk for users with dangerous permissions
-    dangerous_edge_types = [
-        "CAN_IMPERSONATE_SA", 
-        "CAN_CREATE_SERVICE_ACCOUNT_KEY",
-        "CAN_ACT_AS_VIA_VM",
-        "CAN_DEPLOY_FUNCTION_AS",
-        "CAN_DEPLOY_CLOUD_RUN_AS"
-    ]
+    edge_type_risk = EDGE_TYPE_RISK.get
+    role_target_risk = ROLE_TARGET_RISK.get
     
     for node in graph.nodes():
         risk = 0.0
         
-        # Check outgoing edges
-        for _, _, edge_data in graph.out_edges(node, data=True):
-            if edge_data.get('type') in dangerous_edge_types:
-                risk = max(risk, 0.8)
-        
-        # Check if has dangerous roles
-        for _, target in graph.out_edges(node):
-            if target in ["role:roles/owner", "role:roles/iam.securityAdmin"]:
-                risk = max(risk, 0.9)
-            elif target in ["role:roles/editor", "role:roles/iam.serviceAccountTokenCreator"]:
-                risk = max(risk, 0.7)
+        # Dangerous permissions and dangerous roles in a single edge walk
+        for _, target, edge_type in graph.out_edges(node, data='type'):
+            edge_risk = edge_type_risk(edge_type, 0.0)
+            if edge_risk > risk:
+                risk = edge_risk
+            role_risk = role_target_risk(target, 0.0)
+            if role_risk > risk:
+                risk = role_risk
+            if risk >= MAX_NODE_RISK:
+                break
         
         if risk > 0:
             risk_scores[node] = risk
@@ -232,69 +328,86 @@ def generate_risk_scores(graph):
 
 
 def generate_attack_paths(graph):
-    """Generate sample attack paths"""
+    """
+    Generate sample attack paths
+    
+    Paths reference nodes by ID only instead of copying {id, name} dicts. The
+    path modal labels a bare ID without its type prefix, which matches each
+    demo node's name (user:bob@example.com is shown as bob@example.com).
+    """
     attack_paths = [
-        {
-            "path": "user:bob@example.com -> sa:compute@project-1.iam -> project:project-1",
-            "risk_score": 0.85,
-            "description": "User can impersonate compute service account to gain project access",
-            "category": "privilege_escalation",
-            "length": 2,
-            "path_nodes": [
-                {"id": "user:bob@example.com", "name": "bob@example.com"},
-                {"id": "sa:compute@project-1.iam", "name": "compute@project-1.iam"},
-                {"id": "project:project-1", "name": "project-1"}
-            ],
-            "path_edges": [
-                {"type": "CAN_IMPERSONATE_SA", "permission": "iam.serviceAccounts.getAccessToken"},
-                {"type": "HAS_ACCESS_TO", "permission": "compute.*"}
-            ]
-        },
-        {
-            "path": "user:alice@example.com -> sa:app@project-1.iam -> project:project-1",
-            "risk_score": 0.9,
-            "description": "Admin can create service account keys for persistent access",
-            "category": "critical",
-            "length": 2,
-            "path_nodes": [
-                {"id": "user:alice@example.com", "name": "alice@example.com"},
-                {"id": "sa:app@project-1.iam", "name": "app@project-1.iam"},
-                {"id": "project:project-1", "name": "project-1"}
-            ]
-        },
-        {
-            "path": "user:charlie@example.com -> sa:compute@project-2.iam -> project:project-2",
-            "risk_score": 0.75,
-            "description": "User can deploy VMs with service account attached",
-            "category": "privilege_escalation",
-            "length": 2,
-            "path_nodes": [
-                {"id": "user:charlie@example.com", "name": "charlie@example.com"},
-                {"id": "sa:compute@project-2.iam", "name": "compute@project-2.iam"},
-                {"id": "project:project-2", "name": "project-2"}
+        DemoAttackPath(
+            0.85,
+            "User can impersonate compute service account to gain project access",
+            "privilege_escalation",
+            2,
+            ["user:bob@example.com", "sa:compute@project-1.iam", "project:project-1"],
+            [
+                {"source": "user:bob@example.com", "target": "sa:compute@project-1.iam",
+                 "type": CAN_IMPERSONATE_SA, "permission": "iam.serviceAccounts.getAccessToken"},
+                {"source": "sa:compute@project-1.iam", "target": "project:project-1",
+                 "type": "HAS_ACCESS_TO", "permission": "compute.*"}
             ]
-        },
-        {
-            "path": "group:developers@example.com -> sa:app@project-2.iam -> project:project-2",
-            "risk_score": 0.7,
-            "description": "Developer group can deploy Cloud Run services as service account",
-            "category": "lateral_movement",
-            "length": 2,
-            "path_nodes": [
-                {"id": "group:developers@example.com", "name": "developers@example.com"},
-                {"id": "sa:app@project-2.iam", "name": "app@project-2.iam"},
-                {"id": "project:project-2", "name": "project-2"}
-            ]
-        }
+        ),
+        DemoAttackPath(
+            0.9,
+            "Admin can create service account keys for persistent access",
+            "critical",
+            2,
+            ["user:alice@example.com", "sa:app@project-1.iam", "project:project-1"]
+        ),
+        DemoAttackPath(
+            0.75,
+            "User can deploy VMs with service account attached",
+            "privilege_escalation",
+            2,
+            ["user:charlie@example.com", "sa:compute@project-2.iam", "project:project-2"]
+        ),
+        DemoAttackPath(
+            0.7,
+            "Developer group can deploy Cloud Run services as service account",
+            "lateral_movement",
+            2,
+            ["group:developers@example.com", "sa:app@project-2.iam", "project:project-2"]
+        )
     ]
     
     return attack_paths
 
 
+def summarize_graph(graph, risk_scores):
+    """Collect dashboard summary counts in one pass over nodes and one over edges"""
+    node_types = set()
+    for _, node_type in graph.nodes(data='type', default='unknown'):
+        node_types.add(node_type)
+    
+    edge_types = set()
+    edge_count = 0
+    for _, _, edge_type in graph.edges(data='type', default='unknown'):
+        edge_types.add(edge_type)
+        edge_count += 1
+    
+    return {
+        'nodes': len(graph),
+        'edges': edge_count,
+        'node_types': len(node_types),
+        'edge_types': len(edge_types),
+        'high_risk_nodes': sum(1 for score in risk_scores.values() if score > 0.7),
+    }
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Generate the enhanced modals demo dashboard")
+    parser.add_argument("--synthetic-users", type=int, default=0,
+                        help="Generated users to add for load testing the dashboard")
+    parser.add_argument("--synthetic-edges", type=int, default=0,
+                        help="Random edges from generated users to roles and service accounts")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic graph generation")
+    args = parser.parse_args()
+    
     # Create comprehensive graph
     print("Creating comprehensive test graph...")
-    graph = create_comprehensive_graph()
+    graph = create_comprehensive_graph(args.synthetic_users, args.synthetic_edges, args.seed)
     print(f"Created graph with {graph.number_of_nodes()} nodes and {graph.number_of_edges()} edges")
     
     # Generate risk scores
@@ -319,16 +432,17 @@ def main():
     visualizer.create_full_graph(
         output_file=output_file,
         risk_scores=risk_scores,
-        attack_paths=attack_paths
+        attack_paths=[path._asdict() for path in attack_paths]
     )
     
     print(f"\n✅ Visualization created: {output_file}")
     print("\n📊 Graph Statistics:")
-    print(f"   - Total Nodes: {graph.number_of_nodes()}")
-    print(f"   - Total Edges: {graph.number_of_edges()}")
-    print(f"   - Node Types: {len(set(data.get('type', 'unknown') for _, data in graph.nodes(data=True)))}")
-    print(f"   - Edge Types: {len(set(data.get('type', 'unknown') for _, _, data in graph.edges(data=True)))}")
-    print(f"   - High Risk Nodes: {sum(1 for score in risk_scores.values() if score > 0.7)}")
+    summary = summarize_graph(graph, risk_scores)
+    print(f"   - Total Nodes: {summary['nodes']}")
+    print(f"   - Total Edges: {summary['edges']}")
+    print(f"   - Node Types: {summary['node_types']}")
+    print(f"   - Edge Types: {summary['edge_types']}")
+    print(f"   - High Risk Nodes: {summary['high_risk_nodes']}")
     
     print("\n🎯 Enhanced Modal Features to Test:")
     print("1. Click 'Total Nodes' to see the enhanced nodes modal with:")
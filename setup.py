@@ -47,6 +47,9 @@ setup(
         "matplotlib>=3.4",
         "numpy>=1.21",
     ],
+    extras_require={
+        "igraph": ["igraph>=0.10"],
+    },
     entry_points={
         "console_scripts": [
             "escagcp=escagcp.cli:main",
@@ -0,0 +1,477 @@
+"""
+Tests for the attack path analyzer
+"""
+
+import json
+import time
+from collections import defaultdict
+
+import networkx as nx
+import pytest
+
+from escagcp.analyzers.paths import PathAnalyzer
+from escagcp.graph.models import EdgeType, NodeType
+from escagcp.graph.query import bounded_simple_paths
+from escagcp.utils.config import Config
+
+
+class TestPathAnalyzer:
+    """Test the PathAnalyzer class"""
+    
+    @pytest.fixture
+    def analyzer_config(self):
+        """Create a test configuration"""
+        config = Config()
+        config.analysis_max_path_length = 4
+        config.analysis_dangerous_roles = ['roles/owner', 'roles/editor']
+        return config
+    
+    @pytest.fixture
+    def escalation_graph(self):
+        """Create a graph with chained impersonation and non-escalation detours"""
+        graph = nx.DiGraph()
+        graph.add_node('user:alice@example.com', type=NodeType.USER.value, name='alice@example.com')
+        graph.add_node('group:devs@example.com', type=NodeType.GROUP.value, name='devs@example.com')
+        for name in ('sa1', 'sa2', 'sa3'):
+            graph.add_node(f'sa:{name}@p.iam.gserviceaccount.com', type=NodeType.SERVICE_ACCOUNT.value,
+                           name=f'{name}@p.iam.gserviceaccount.com')
+        graph.add_node('project:p', type=NodeType.PROJECT.value, name='projects/p')
+        graph.add_node('role:roles/owner', type=NodeType.ROLE.value, name='roles/owner')
+        
+        graph.add_edge('user:alice@example.com', 'group:devs@example.com', type=EdgeType.MEMBER_OF.value)
+        graph.add_edge('group:devs@example.com', 'sa:sa1@p.iam.gserviceaccount.com',
+                       type=EdgeType.CAN_IMPERSONATE_SA.value)
+        graph.add_edge('user:alice@example.com', 'sa:sa2@p.iam.gserviceaccount.com',
+                       type=EdgeType.CAN_DEPLOY_FUNCTION_AS.value)
+        graph.add_edge('sa:sa1@p.iam.gserviceaccount.com', 'sa:sa2@p.iam.gserviceaccount.com',
+                       type=EdgeType.CAN_CREATE_SERVICE_ACCOUNT_KEY.value)
+        graph.add_edge('sa:sa2@p.iam.gserviceaccount.com', 'sa:sa3@p.iam.gserviceaccount.com',
+                       type=EdgeType.CAN_ACT_AS_VIA_VM.value)
+        graph.add_edge('sa:sa3@p.iam.gserviceaccount.com', 'sa:sa1@p.iam.gserviceaccount.com',
+                       type=EdgeType.CAN_IMPERSONATE_SA.value)
+        graph.add_edge('sa:sa3@p.iam.gserviceaccount.com', 'project:p', type=EdgeType.HAS_ACCESS_TO.value)
+        graph.add_edge('sa:sa3@p.iam.gserviceaccount.com', 'role:roles/owner', type=EdgeType.HAS_ROLE.value,
+                       role='roles/owner')
+        graph.add_edge('user:alice@example.com', 'role:roles/owner', type=EdgeType.HAS_ROLE.value,
+                       role='roles/owner')
+        return graph
+    
+    def _reference_multi_hop_paths(self, graph, cutoff):
+        """Enumerate multi-hop escalation paths the straightforward way"""
+        escalation_types = {edge_type.value for edge_type in PathAnalyzer.ESCALATION_EDGE_TYPES}
+        identities = [n for n in graph.nodes() if n.startswith(('user:', 'sa:', 'group:'))]
+        targets = [n for n in graph.nodes() if n.startswith(('sa:', 'role:', 'project:', 'folder:', 'org:'))]
+        
+        expected = []
+        for identity in identities:
+            for target in targets:
+                if identity == target:
+                    continue
+                for path in nx.all_simple_paths(graph, identity, target, cutoff=cutoff):
+                    count = sum(
+                        1 for u, v in zip(path, path[1:])
+                        if graph.edges[u, v].get('type') in escalation_types
+                    )
+                    if count:
+                        expected.append((tuple(path), count))
+        return expected
+    
+    def test_multi_hop_paths_match_all_simple_paths(self, analyzer_config, escalation_graph):
+        """Test the escalation search reports exactly the escalating simple paths"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        
+        expected = self._reference_multi_hop_paths(escalation_graph, analyzer_config.analysis_max_path_length)
+        expected_multi = [path for path, count in expected if count >= 2]
+        expected_single = [path for path, count in expected if count == 1]
+        
+        found_multi = [
+            tuple(node.id for node in path.path_nodes)
+            for path in analyzer._attack_paths['critical_multi_step']
+        ]
+        # Paths with a single escalation edge from the same search
+        found_single = [
+            tuple(node.id for node in path.path_nodes)
+            for path in analyzer._attack_paths['privilege_escalation']
+        ]
+        
+        assert found_multi == expected_multi
+        assert found_single == expected_single
+        assert ('user:alice@example.com', 'group:devs@example.com', 'sa:sa1@p.iam.gserviceaccount.com',
+                'sa:sa2@p.iam.gserviceaccount.com', 'sa:sa3@p.iam.gserviceaccount.com') in found_multi
+    
+    @staticmethod
+    def _escalation_search_args(analyzer, graph, config):
+        """Build the _find_escalation_paths_from arguments that follow the source"""
+        escalation_values = analyzer.ESCALATION_EDGE_VALUES
+        escalation_sources = [
+            source for source, _, data in graph.edges(data=True)
+            if data.get('type') in escalation_values
+        ]
+        targets = {node_id: i for i, node_id in enumerate(analyzer._high_value_nodes)}
+        target_distance = analyzer._target_distances(analyzer._high_value_nodes)
+        return (
+            targets,
+            config.analysis_max_path_length,
+            analyzer._escalation_adjacency(escalation_values, targets, target_distance),
+            analyzer._hops_backward_from(escalation_sources),
+            target_distance
+        )
+    
+    def test_escalation_search_stops_at_paths_per_target(self, analyzer_config, escalation_graph):
+        """Test a per-target limit keeps the first paths the unlimited search finds to each target"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        search_args = self._escalation_search_args(analyzer, escalation_graph, analyzer_config)
+        
+        unlimited = list(analyzer._find_escalation_paths_from('user:alice@example.com', *search_args))
+        for limit in (1, 2):
+            expected = []
+            per_target = {}
+            for path, escalations in unlimited:
+                if per_target.get(path[-1], 0) < limit:
+                    per_target[path[-1]] = per_target.get(path[-1], 0) + 1
+                    expected.append((path, escalations))
+            limited = list(analyzer._find_escalation_paths_from('user:alice@example.com', *search_args, limit))
+            assert limited == expected
+        assert len(unlimited) > len(per_target)
+    
+    def test_escalation_search_reports_only_targets_cut_short(self, analyzer_config, escalation_graph):
+        """Test a target is reported as limited only when it has more paths than the limit"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        search_args = self._escalation_search_args(analyzer, escalation_graph, analyzer_config)
+        
+        counts = defaultdict(int)
+        for path, _ in analyzer._find_escalation_paths_from('user:alice@example.com', *search_args):
+            counts[path[-1]] += 1
+        for limit in (1, 2, max(counts.values())):
+            limited_targets = []
+            list(analyzer._find_escalation_paths_from('user:alice@example.com', *search_args, limit, None,
+                                                      limited_targets))
+            assert sorted(limited_targets) == sorted(target for target, count in counts.items() if count > limit)
+        assert max(counts.values()) > 1
+    
+    def test_multi_hop_paths_respect_max_length(self, analyzer_config, escalation_graph):
+        """Test no reported path is longer than the configured maximum"""
+        analyzer_config.analysis_max_path_length = 2
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        
+        for bucket in ('critical_multi_step', 'privilege_escalation'):
+            for path in analyzer._attack_paths[bucket]:
+                assert len(path) <= 2
+    
+    def test_non_escalation_paths_are_not_reported(self, analyzer_config, escalation_graph):
+        """Test a plain role grant is not reported as a multi-hop escalation"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        
+        reported = {
+            tuple(node.id for node in path.path_nodes)
+            for path in analyzer._attack_paths['privilege_escalation']
+        }
+        assert ('user:alice@example.com', 'role:roles/owner') not in reported
+    
+    def test_risk_scores_use_degree_centrality(self, analyzer_config, escalation_graph):
+        """Test each node's centrality term matches the graph-wide degree centrality"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._calculate_risk_scores()
+        
+        centrality = nx.degree_centrality(escalation_graph)
+        for node_id, scores in analyzer._risk_scores.items():
+            assert scores['centrality'] == centrality[node_id]
+        assert analyzer._risk_scores['role:roles/owner']['base'] >= 0.5
+    
+    def test_critical_nodes_sample_betweenness_on_large_graphs(self, analyzer_config):
+        """Test betweenness centrality is approximated only above the exact-size limit"""
+        graph = nx.DiGraph()
+        nx.add_path(graph, [f'sa:sa{i}@p.iam.gserviceaccount.com' for i in range(1200)],
+                    type=EdgeType.CAN_IMPERSONATE_SA.value)
+        analyzer_config.analysis_centrality_sample_k = 50
+        
+        analyzer = PathAnalyzer(graph, analyzer_config)
+        analyzer._identify_critical_nodes()
+        assert analyzer._critical_nodes
+        assert all(node['centrality_approximate'] for node in analyzer._critical_nodes)
+        
+        analyzer_config.analysis_centrality_sample_k = 0
+        analyzer = PathAnalyzer(graph, analyzer_config)
+        analyzer._identify_critical_nodes()
+        assert not any(node['centrality_approximate'] for node in analyzer._critical_nodes)
+    
+    def test_igraph_betweenness_matches_networkx(self, analyzer_config, escalation_graph):
+        """Test igraph betweenness centrality matches NetworkX's normalized values"""
+        pytest.importorskip('igraph')
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        
+        expected = nx.betweenness_centrality(escalation_graph)
+        actual = analyzer._igraph_betweenness()
+        assert actual.keys() == expected.keys()
+        for node_id, value in expected.items():
+            assert actual[node_id] == pytest.approx(value)
+    
+    def test_lateral_movement_pairs_projects_sharing_an_identity(self, analyzer_config):
+        """Test a lateral movement path is reported for each project pair an identity can reach"""
+        graph = nx.DiGraph()
+        for project in ('project:a', 'project:b', 'project:c'):
+            graph.add_node(project, type=NodeType.PROJECT.value, name=project)
+        graph.add_node('user:bob@example.com', type=NodeType.USER.value, name='bob@example.com')
+        graph.add_node('user:eve@example.com', type=NodeType.USER.value, name='eve@example.com')
+        for project in ('project:a', 'project:b', 'project:c'):
+            graph.add_edge('user:bob@example.com', project, type=EdgeType.HAS_ACCESS_TO.value)
+        graph.add_edge('user:eve@example.com', 'project:a', type=EdgeType.HAS_ACCESS_TO.value)
+        
+        analyzer = PathAnalyzer(graph, analyzer_config)
+        analyzer._find_lateral_movement_paths()
+        
+        paths = analyzer._attack_paths['lateral_movement']
+        assert all(len(path.path_nodes) == 3 and len(path.path_edges) == 2 for path in paths)
+        assert all(edge.source_id == 'user:bob@example.com' for path in paths for edge in path.path_edges)
+        reported = sorted(
+            (path.path_nodes[1].id, path.path_nodes[0].id, path.path_nodes[2].id)
+            for path in paths
+        )
+        assert reported == [
+            ('user:bob@example.com', 'project:a', 'project:b'),
+            ('user:bob@example.com', 'project:a', 'project:c'),
+            ('user:bob@example.com', 'project:b', 'project:c'),
+        ]
+        for path in paths:
+            first, identity, second = (node.get_display_name() for node in path.path_nodes)
+            assert path.get_path_string() == (
+                f"{first} <--[has_access_to]-- {identity} --[has_access_to]--> {second}"
+            )
+        
+        # Other paths do not borrow the opposite edge for a hop with no forward edge
+        assert analyzer._build_attack_path(['project:a', 'user:bob@example.com']).path_edges == []
+    
+    def test_attack_paths_share_node_and_edge_objects(self, analyzer_config, escalation_graph):
+        """Test paths through the same nodes and edges reuse the same objects"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        first = analyzer._build_attack_path(['user:alice@example.com', 'sa:sa2@p.iam.gserviceaccount.com',
+                                             'sa:sa3@p.iam.gserviceaccount.com'])
+        second = analyzer._build_attack_path(['sa:sa2@p.iam.gserviceaccount.com',
+                                              'sa:sa3@p.iam.gserviceaccount.com', 'project:p'])
+        
+        assert first.path_nodes[1] is second.path_nodes[0]
+        assert first.path_edges[1] is second.path_edges[0]
+        assert first.path_edges[1].type == EdgeType.CAN_ACT_AS_VIA_VM
+        assert (first.visualization_metadata['node_metadata'][1]
+                is second.visualization_metadata['node_metadata'][0])
+        assert (first.visualization_metadata['edge_metadata'][1]
+                is second.visualization_metadata['edge_metadata'][0])
+    
+    def test_paths_from_identity_only_reach_connected_service_accounts(self, analyzer_config, escalation_graph):
+        """Test unreachable service accounts yield no paths from an identity"""
+        escalation_graph.add_node('sa:orphan@p.iam.gserviceaccount.com', type=NodeType.SERVICE_ACCOUNT.value,
+                                  name='orphan@p.iam.gserviceaccount.com')
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        
+        paths = analyzer.find_paths_from_identity('user:alice@example.com')
+        
+        expected = [
+            tuple(path)
+            for target in escalation_graph.nodes() if target.startswith('sa:')
+            for path in nx.all_simple_paths(escalation_graph, 'user:alice@example.com', target,
+                                            cutoff=analyzer_config.analysis_max_path_length)
+        ]
+        assert [tuple(node.id for node in path.path_nodes) for path in paths] == expected
+        assert all(path.target_node.id != 'sa:orphan@p.iam.gserviceaccount.com' for path in paths)
+    
+    def test_bounded_simple_paths_match_all_simple_paths(self):
+        """Test the pruned simple path search yields exactly NetworkX's paths in order"""
+        for seed in range(5):
+            graph = nx.gnp_random_graph(12, 0.25, seed=seed, directed=True)
+            for source, target in ((0, 11), (3, 7), (5, 5)):
+                for cutoff in (2, 3, 5, None):
+                    assert list(bounded_simple_paths(graph, source, target, cutoff)) == \
+                        list(nx.all_simple_paths(graph, source, target, cutoff=cutoff))
+    
+    def test_vulnerabilities_flag_dangerous_roles(self, analyzer_config, escalation_graph):
+        """Test principals holding dangerous roles are reported"""
+        escalation_graph.add_node('user:mallory@attacker.com', type=NodeType.USER.value, name='mallory@attacker.com')
+        escalation_graph.add_node('role:roles/viewer', type=NodeType.ROLE.value, name='roles/viewer')
+        escalation_graph.add_edge('user:mallory@attacker.com', 'role:roles/owner', type=EdgeType.HAS_ROLE.value)
+        escalation_graph.add_edge('user:mallory@attacker.com', 'role:roles/viewer', type=EdgeType.HAS_ROLE.value)
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._detect_vulnerabilities()
+        
+        findings = {(v['type'], v['resource']): v['roles'] for v in analyzer._vulnerabilities}
+        assert findings == {
+            ('overprivileged_service_account', 'sa:sa3@p.iam.gserviceaccount.com'): ['role:roles/owner'],
+            ('external_user_high_privilege', 'user:mallory@attacker.com'): ['role:roles/owner'],
+        }
+    
+    def test_vulnerabilities_use_configured_internal_domains(self, analyzer_config, escalation_graph):
+        """Test users outside the configured internal domains are treated as external"""
+        analyzer_config.analysis_internal_domains = ['attacker.com']
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._detect_vulnerabilities()
+        
+        external = [v['resource'] for v in analyzer._vulnerabilities if v['type'] == 'external_user_high_privilege']
+        assert external == ['user:alice@example.com']
+    
+    def test_attack_path_buckets_respect_limit(self, analyzer_config, escalation_graph):
+        """Test each bucket stops at the configured limit and never repeats a path"""
+        analyzer_config.analysis_max_paths_per_bucket = 2
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        analyzer._find_privilege_escalation_paths()
+        
+        for bucket in ('critical_multi_step', 'privilege_escalation', 'critical'):
+            reported = [tuple(node.id for node in path.path_nodes) for path in analyzer._attack_paths[bucket]]
+            assert len(reported) == 2
+            assert len(set(reported)) == 2
+    
+    def test_multi_hop_search_stops_at_path_budget(self, analyzer_config, escalation_graph):
+        """Test the multi-hop search reports no more paths than the total budget"""
+        analyzer_config.analysis_max_total_paths = 3
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        
+        reported = len(analyzer._attack_paths['critical_multi_step']) + \
+            len(analyzer._attack_paths['privilege_escalation'])
+        assert reported == 3
+    
+    def test_multi_hop_search_stops_at_time_budget_inside_search(self, analyzer_config):
+        """Test the time budget cuts short one identity's long search that finds no paths"""
+        # Every walk through the clique has to return to the visited hub to reach the
+        # target, so the search explores a huge number of dead ends before any path
+        graph = nx.DiGraph()
+        graph.add_node('user:alice@example.com', type=NodeType.USER.value, name='alice@example.com')
+        graph.add_edge('user:alice@example.com', 'resource:hub', type=EdgeType.CAN_IMPERSONATE_SA.value)
+        clique = [f'resource:c{i}' for i in range(12)]
+        for node in clique:
+            graph.add_edge('resource:hub', node, type=EdgeType.HAS_ROLE.value)
+            graph.add_edge(node, 'resource:hub', type=EdgeType.HAS_ROLE.value)
+            for other in clique:
+                if other != node:
+                    graph.add_edge(node, other, type=EdgeType.HAS_ROLE.value)
+        graph.add_edge('resource:hub', 'project:target', type=EdgeType.HAS_ROLE.value)
+        analyzer_config.analysis_max_path_length = 12
+        analyzer_config.analysis_time_budget_s = 0.05
+        
+        analyzer = PathAnalyzer(graph, analyzer_config)
+        start = time.monotonic()
+        analyzer._find_privilege_escalation_paths()
+        assert time.monotonic() - start < 5
+    
+    def test_multi_hop_search_with_worker_processes_matches_in_process(self, analyzer_config, escalation_graph):
+        """Test searching identities in worker processes reports the same paths in the same order"""
+        for i in range(80):
+            user = f'user:u{i}@example.com'
+            escalation_graph.add_node(user, type=NodeType.USER.value, name=f'u{i}@example.com')
+            escalation_graph.add_edge(user, f'sa:sa{i % 3 + 1}@p.iam.gserviceaccount.com',
+                                      type=EdgeType.CAN_IMPERSONATE_SA.value)
+        
+        def reported(workers):
+            analyzer_config.analysis_workers = workers
+            analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+            analyzer._find_privilege_escalation_paths()
+            return {
+                bucket: [tuple(node.id for node in path.path_nodes) for path in analyzer._attack_paths[bucket]]
+                for bucket in ('critical_multi_step', 'privilege_escalation')
+            }
+        
+        assert reported(2) == reported(0) == reported(1)
+    
+    def test_statistics_count_high_risk_nodes(self, analyzer_config):
+        """Test the high-risk node count matches the risk scores above the threshold"""
+        graph = nx.DiGraph()
+        graph.add_node('role:roles/owner', type=NodeType.ROLE.value, name='roles/owner')
+        for name in ('sa1', 'sa2'):
+            sa = f'sa:{name}@p.iam.gserviceaccount.com'
+            graph.add_node(sa, type=NodeType.SERVICE_ACCOUNT.value, name=f'{name}@p.iam.gserviceaccount.com')
+            graph.add_edge(sa, 'role:roles/owner', type=EdgeType.HAS_ROLE.value)
+            graph.add_edge('role:roles/owner', sa, type=EdgeType.HAS_ROLE.value)
+        analyzer = PathAnalyzer(graph, analyzer_config)
+        analyzer._calculate_risk_scores()
+        
+        assert analyzer._risk_scores['role:roles/owner']['total'] > 0.7
+        expected = sum(1 for scores in analyzer._risk_scores.values() if scores['total'] > 0.7)
+        assert analyzer._calculate_statistics()['high_risk_nodes'] == expected
+    
+    def test_shared_escalation_techniques_are_read_only(self, analyzer_config, escalation_graph):
+        """Test paths share technique entries that cannot be changed and still serialize to JSON"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        first = analyzer._build_attack_path(['user:alice@example.com', 'sa:sa2@p.iam.gserviceaccount.com',
+                                             'sa:sa3@p.iam.gserviceaccount.com'])
+        second = analyzer._build_attack_path(['sa:sa2@p.iam.gserviceaccount.com',
+                                              'sa:sa3@p.iam.gserviceaccount.com', 'project:p'])
+        
+        technique = first.visualization_metadata['escalation_techniques'][1]
+        assert technique is second.visualization_metadata['escalation_techniques'][0]
+        with pytest.raises(TypeError):
+            technique['name'] = 'changed'
+        
+        record = json.loads(json.dumps(first.to_dict()))
+        assert record['visualization_metadata']['escalation_techniques'][1] == dict(technique)
+        assert json.loads(json.dumps(first.get_attack_graph_data()))['techniques'][1] == dict(technique)
+
+    def test_per_edge_techniques_and_metadata_are_read_only(self, analyzer_config, escalation_graph):
+        """Test per-edge techniques and node and edge metadata shared by paths cannot be changed"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        first = analyzer._build_attack_path(['sa:sa2@p.iam.gserviceaccount.com',
+                                             'sa:sa3@p.iam.gserviceaccount.com', 'role:roles/owner'])
+        second = analyzer._build_attack_path(['sa:sa3@p.iam.gserviceaccount.com', 'role:roles/owner'])
+
+        technique = first.visualization_metadata['escalation_techniques'][1]
+        assert technique is second.visualization_metadata['escalation_techniques'][0]
+        assert technique['permission'] == 'roles/owner'
+        node_meta = first.visualization_metadata['node_metadata'][1]
+        edge_meta = first.visualization_metadata['edge_metadata'][1]
+        assert node_meta is second.visualization_metadata['node_metadata'][0]
+        assert edge_meta is second.visualization_metadata['edge_metadata'][0]
+        for entry in (technique, node_meta, edge_meta):
+            with pytest.raises(TypeError):
+                entry['label'] = 'changed'
+        with pytest.raises(TypeError):
+            edge_meta['properties']['role'] = 'roles/viewer'
+
+        record = json.loads(json.dumps(first.to_dict()))['visualization_metadata']
+        assert record['edge_metadata'][1]['properties'] == {'role': 'roles/owner'}
+        graph_data = json.loads(json.dumps(first.get_attack_graph_data()))
+        assert graph_data['nodes'][1]['label'] == node_meta['label']
+        assert graph_data['edges'][1]['properties'] == {'role': 'roles/owner'}
+
+    def test_analyze_all_paths_returns_read_only_buckets(self, analyzer_config, escalation_graph):
+        """Test the returned attack path buckets reflect the analyzer without being writable"""
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        results = analyzer.analyze_all_paths()
+        
+        assert results['attack_paths']['critical_multi_step'] is analyzer._attack_paths['critical_multi_step']
+        assert results['attack_paths'].get('missing', []) == []
+        with pytest.raises(TypeError):
+            results['attack_paths']['critical'] = []
+    
+    def test_stream_to_jsonl_writes_paths_instead_of_keeping_them(self, analyzer_config, escalation_graph, tmp_path):
+        """Test streamed attack paths are written per line and still counted in the statistics"""
+        expected = PathAnalyzer(escalation_graph, analyzer_config).analyze_all_paths()
+        output_path = tmp_path / 'paths.jsonl'
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        results = analyzer.stream_to_jsonl(str(output_path))
+        
+        records = [json.loads(line) for line in output_path.read_text().splitlines()]
+        assert len(records) == expected['statistics']['total_attack_paths'] > 0
+        assert sorted(record['category'] for record in records) == sorted(
+            bucket for bucket, paths in expected['attack_paths'].items() for _ in paths
+        )
+        assert not any(results['attack_paths'].values())
+        assert results['statistics'] == expected['statistics']
+    
+    def test_paths_per_pair_respect_limit(self, analyzer_config, escalation_graph):
+        """Test no identity and target pair reports more paths than the configured limit"""
+        analyzer_config.analysis_max_paths_per_pair = 1
+        analyzer = PathAnalyzer(escalation_graph, analyzer_config)
+        analyzer._find_privilege_escalation_paths()
+        
+        pairs = [
+            (path.source_node.id, path.target_node.id)
+            for bucket in ('critical_multi_step', 'privilege_escalation')
+            for path in analyzer._attack_paths[bucket]
+        ]
+        assert pairs
+        assert len(pairs) == len(set(pairs))
+        
+        from_identity = analyzer.find_paths_from_identity('user:alice@example.com')
+        targets = [path.target_node.id for path in from_identity]
+        assert len(targets) == len(set(targets))
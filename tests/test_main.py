@@ -177,6 +177,60 @@ class TestFullWorkflow:
         )
         assert isinstance(can_access, bool)
     
+    def test_graph_query_sees_graph_changes_after_first_query(self, mock_config):
+        """Test reachability reflects edges added after a query was answered"""
+        from escagcp.graph.models import Node, NodeType
+        graph = nx.DiGraph()
+        nodes = {}
+        for node_id, node_type in [('user:eve@example.com', NodeType.USER),
+                                   ('role:roles/iam.serviceAccountTokenCreator', NodeType.ROLE),
+                                   ('sa:sa1@test-project-1.iam.gserviceaccount.com', NodeType.SERVICE_ACCOUNT)]:
+            nodes[node_id] = Node(id=node_id, type=node_type, name=node_id.split(':', 1)[1])
+            graph.add_node(node_id, type=node_type.value)
+        graph.add_edge('user:eve@example.com', 'role:roles/iam.serviceAccountTokenCreator', type='has_role')
+        query = GraphQuery(graph, nodes, mock_config)
+        
+        source = 'user:eve@example.com'
+        target = 'sa:sa1@test-project-1.iam.gserviceaccount.com'
+        assert query.find_all_paths(source, target) == []
+        assert query.find_shortest_path(source, target) is None
+        
+        graph.add_edge('role:roles/iam.serviceAccountTokenCreator', target, type='can_impersonate')
+        assert len(query.find_all_paths(source, target)) == 1
+        assert query.find_shortest_path(source, target) is not None
+        assert [path.target_node.id for path in query.find_impersonation_paths(source)] == [target]
+
+    def test_graph_query_sees_edge_changes_after_path_found(self, mock_config):
+        """Test paths are rebuilt from edges changed or removed after a query found them"""
+        from escagcp.graph.models import Node, NodeType
+        graph = nx.DiGraph()
+        nodes = {}
+        for node_id, node_type in [('user:eve@example.com', NodeType.USER),
+                                   ('role:roles/iam.serviceAccountTokenCreator', NodeType.ROLE),
+                                   ('sa:sa1@test-project-1.iam.gserviceaccount.com', NodeType.SERVICE_ACCOUNT)]:
+            nodes[node_id] = Node(id=node_id, type=node_type, name=node_id.split(':', 1)[1])
+            graph.add_node(node_id, type=node_type.value)
+        role = 'role:roles/iam.serviceAccountTokenCreator'
+        source = 'user:eve@example.com'
+        target = 'sa:sa1@test-project-1.iam.gserviceaccount.com'
+        graph.add_edge(source, role, type='has_role')
+        graph.add_edge(role, target, type='can_act_as_via_vm')
+        query = GraphQuery(graph, nodes, mock_config)
+
+        first = query.find_all_paths(source, target)
+        assert [edge.type.value for edge in first[0].path_edges] == ['has_role', 'can_act_as_via_vm']
+        assert query.find_impersonation_paths(source) == []
+
+        graph.add_edge(role, target, type='can_impersonate', reason='token creator')
+        second = query.find_all_paths(source, target)
+        assert [edge.type.value for edge in second[0].path_edges] == ['has_role', 'can_impersonate']
+        assert second[0].path_edges[1].properties == {'reason': 'token creator'}
+        assert [path.target_node.id for path in query.find_impersonation_paths(source)] == [target]
+
+        graph.remove_edge(role, target)
+        assert query.find_all_paths(source, target) == []
+        assert query.find_impersonation_paths(source) == []
+
     def test_iam_simulation(self, mock_config, sample_graph, sample_nodes):
         """Test IAM change simulation"""
         # Add the user node that will be used in simulation
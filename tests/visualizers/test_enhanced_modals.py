@@ -1,7 +1,10 @@
 """Unit tests for enhanced modal functionality in HTML visualizer"""
 
+import base64
+import gzip
 import pytest
 import json
+import re
 import networkx as nx
 from escagcp.visualizers.html import HTMLVisualizer
 from escagcp.utils import Config
@@ -219,6 +222,56 @@ class TestEnhancedModals:
         assert 'onclick="showModal(\'nodes\')"' in html
         assert 'onclick="showModal(\'edges\')"' in html
     
+    def test_dashboard_embeds_gzipped_graph_payload(self, visualizer):
+        """Test the shared-report graph data is embedded gzipped and only read after loadGraphData"""
+        risk_scores = {"user:test@example.com": 0.8}
+        html = visualizer._create_dashboard_html(risk_scores, [], None)
+        
+        match = re.search(r'const graphDataGzip = "([A-Za-z0-9+/=]*)";', html)
+        assert match is not None
+        payload = json.loads(gzip.decompress(base64.b64decode(match.group(1))))
+        assert payload == visualizer._serialize_graph_for_standalone(risk_scores, None)
+        
+        # Only createStandaloneHTML, run after await loadGraphData(), reads graphData's fields
+        start = html.index('function createStandaloneHTML()')
+        end = html.index('return html;', start)
+        assert re.search(r'\bgraphData\.', html[start:end])
+        assert not re.search(r'\bgraphData\.', html[:start] + html[end:])
+    
+    def test_dangerous_role_holders_in_high_risk_stats_and_list(self):
+        """Test dangerous role holders are counted and listed once, after higher scored nodes"""
+        graph = nx.DiGraph()
+        graph.add_node("user:alice@example.com", type="user", name="alice@example.com")
+        graph.add_node("user:carol@example.com", type="user", name="carol@example.com")
+        graph.add_node("group:ops@example.com", type="group", name="ops@example.com")
+        graph.add_node("user:bob@example.com", type="user", name="bob@example.com")
+        graph.add_node("sa:deployer@project.iam", type="service_account", name="deployer@project.iam")
+        graph.add_node("role:roles/owner", type="role", name="roles/owner")
+        graph.add_node("role:roles/viewer", type="role", name="roles/viewer")
+        for holder in ("sa:deployer@project.iam", "group:ops@example.com",
+                       "user:carol@example.com", "user:alice@example.com"):
+            graph.add_edge(holder, "role:roles/owner", type="HAS_ROLE")
+        graph.add_edge("user:bob@example.com", "role:roles/viewer", type="HAS_ROLE")
+        visualizer = HTMLVisualizer(graph, Config())
+        
+        # alice holds a dangerous role and is already high risk; carol holds one but scores low
+        risk_scores = {
+            "user:alice@example.com": {"total": 0.9},
+            "user:bob@example.com": {"total": 0.65},
+            "user:carol@example.com": {"total": 0.3},
+        }
+        assert visualizer._dangerous_role_holders() == [
+            "user:alice@example.com", "user:carol@example.com",
+            "group:ops@example.com", "sa:deployer@project.iam",
+        ]
+        assert visualizer._calculate_statistics(risk_scores, [])['high_risk_nodes'] == 5
+        
+        html = visualizer._create_high_risk_nodes_html(risk_scores)
+        names = re.findall(r'<li class="modal-list-item">\s*(\S+)', html)
+        assert names == ["alice@example.com", "carol@example.com", "ops@example.com",
+                         "deployer@project.iam", "bob@example.com"]
+        assert re.findall(r'Risk: ([0-9.]+)', html) == ["0.90", "0.70", "0.70", "0.70", "0.65"]
+    
     def test_clean_node_name(self, visualizer):
         """Test the _clean_node_name method"""
         # Test various node name formats